@@ -329,6 +329,7 @@ def _make_adapter_from_profile(prof: Dict) -> AdapterProtocol:
             serial_port=str(plant_prof.get("serial_port", "/dev/ttyUSB0")),
             serial_baud=int(plant_prof.get("serial_baud", 115200)),
             telemetry_timeout_sec=float(plant_prof.get("telemetry_timeout_sec", 2.0)),
+            binary=bool(plant_prof.get("binary", False)),
         )
     raise ValueError(f"Unknown plant.adapter kind: {adapter_kind}")
 
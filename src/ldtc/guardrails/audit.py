@@ -17,7 +17,7 @@ import json
 import os
 import threading
 import time
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 
@@ -118,8 +118,14 @@ class AuditLog:
                 hash=h,
             )
             self._prev_hash = h
+            # The stored line is the hashed payload plus "hash", which sorts
+            # just before "prev_hash"; splice it in rather than re-encoding
+            # the whole record. "prev_hash" and "ts" are the last keys, so
+            # the rightmost match is the real one even if details echo it.
+            k = raw.rindex(', "prev_hash": ')
+            line = f'{raw[:k]}, "hash": "{h}"{raw[k:]}\n'
             with open(self.path, "a", encoding="utf-8") as f:
-                f.write(json.dumps(asdict(rec), sort_keys=True) + "\n")
+                f.write(line)
             return rec
 
     @property
@@ -22,19 +22,21 @@ from __future__ import annotations
 import importlib
 import importlib.util
 from dataclasses import dataclass
-from typing import Callable, List, Sequence, Tuple
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Sequence, Tuple
 
 import numpy as np
+from joblib import Parallel, delayed
+from scipy.linalg import qr as sp_qr
 from scipy.spatial import cKDTree
 from scipy.special import digamma
-from sklearn.feature_selection import mutual_info_regression
 
 from ldtc.runtime.windows import block_bootstrap_indices
 
 from .diagnostics import var_nt_ratio
 
 # Lightweight lagged linear-Granger-like estimator
-# and mutual information aggregators (sklearn and Kraskov k-NN).
+# and mutual information aggregators (sklearn-style and Kraskov k-NN).
 #
 # We treat 'signals' as a matrix X (T, N), with `order` naming columns.
 # Given partition sets C (indices) and Ex (indices), we compute:
@@ -42,6 +44,12 @@ from .diagnostics import var_nt_ratio
 #   L_exchange: average directed influence from Ex -> nodes in C
 # Returns point estimates and simple bootstrap CIs.
 
+# Element budget for one gathered chunk of bootstrap replicates (~1 MiB of float64)
+_BOOT_BATCH_ELEMS = 1 << 17
+# Window length from which KSG k-NN queries use all cores; shorter windows
+# finish faster than the thread pool starts
+_KSG_THREADED_MIN_T = 8192
+
 
 @dataclass
 class LResult:
@@ -69,34 +77,298 @@ class LResult:
 def _lag_matrix(x: np.ndarray, p: int) -> Tuple[np.ndarray, np.ndarray]:
     """Construct lagged design matrix and targets for VAR-like regression.
 
+    The design is a read-only strided view over a C-contiguous copy of `x`
+    (no copy at all when `x` already is one): row `t` of `X` is the flat
+    run of samples `t .. t+p-1`, so column `(p - lag) * N + s` holds signal
+    `s` at lag `lag`. Consumers select columns by fancy indexing, which
+    yields fresh arrays, so the view is never written through.
+
     Args:
-        x: Array of shape `(T, N)`, time major.
+        x: Array of shape `(T, N)`, time major, or a stack of such arrays
+            with shape `(D, T, N)` (e.g., bootstrap replicates).
         p: Number of lags to include (`p >= 1`).
 
     Returns:
-        A tuple `(X, Y)` where `X` has shape `(T - p, N*p)` and `Y` has
-        shape `(T - p, N)` containing the aligned, non-overlapping targets.
+        A tuple `(X, Y)` where `X` has shape `(..., T - p, N*p)` and `Y` has
+        shape `(..., T - p, N)` containing the aligned, non-overlapping
+        targets. Leading stack dimensions of `x` are preserved.
 
     Raises:
         ValueError: If there are not enough samples (`T <= p`).
     """
-    T, N = x.shape
+    T, N = x.shape[-2:]
     if T <= p:
         raise ValueError("Not enough samples for lagged model")
-    Y = x[p:]
-    Xlags = []
-    for lag in range(1, p + 1):
-        Xlags.append(x[p - lag : T - lag])
-    X = np.concatenate(Xlags, axis=1)  # (T-p, N*p)
+    x = np.ascontiguousarray(x, dtype=np.result_type(x.dtype, np.float64))
+    Y = x[..., p:, :]
+    row, col = x.strides[-2:]
+    X = np.lib.stride_tricks.as_strided(
+        x,
+        shape=x.shape[:-2] + (T - p, N * p),
+        strides=x.strides[:-2] + (row, col),
+        writeable=False,
+    )  # (..., T-p, N*p), oldest lag first
     return X, Y
 
 
+def _qr_economic(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Economic QR factorization of each matrix in a stack.
+
+    A single matrix goes through SciPy's LAPACK wrapper with finiteness
+    checks disabled, which is markedly faster than `np.linalg.qr` on the
+    tall, thin designs used here. Larger stacks use NumPy's stacked QR,
+    which avoids per-matrix wrapper overhead.
+
+    Args:
+        A: Stacked matrices of shape `(D, M, K)`.
+
+    Returns:
+        A tuple `(Q, R)` of shapes `(D, M, min(M, K))` and
+        `(D, min(M, K), K)`.
+    """
+    if A.shape[0] != 1:
+        return np.linalg.qr(A, mode="reduced")
+    Q, R = sp_qr(A[0], mode="economic", check_finite=False)
+    return Q[None], R[None]
+
+
+def _qr_r(A: np.ndarray) -> np.ndarray:
+    """Triangular factor of the economic QR of each matrix in a stack.
+
+    Like [`_qr_economic`][ldtc.lmeas.estimators._qr_economic] but skips
+    forming `Q`, for callers that only need `R`.
+
+    Args:
+        A: Stacked matrices of shape `(D, M, K)`.
+
+    Returns:
+        Array `R` of shape `(D, min(M, K), K)`.
+    """
+    if A.shape[0] != 1:
+        return np.asarray(np.linalg.qr(A, mode="r"))
+    R = sp_qr(A[0], mode="r", check_finite=False)[0]
+    return R[None, : min(A.shape[-2:])]
+
+
+def _proj_sq_norm(A: np.ndarray, r: np.ndarray, tol: np.ndarray | None = None) -> np.ndarray:
+    """Squared norm of the projection of `r` onto the column space of `A`.
+
+    Batched equivalent of `||A @ lstsq(A, r)||²`. A stacked QR of `A` gives
+    the projection directly as `||Qᵀ r||²`; stack entries whose `R` diagonal
+    signals rank deficiency are redone with an SVD that drops singular
+    values at or below `tol`. By default `tol` is `eps * max(M, K)` times
+    the largest singular value of `A`, matching
+    `np.linalg.lstsq(..., rcond=None)`.
+
+    Args:
+        A: Stacked design matrices of shape `(D, M, K)`.
+        r: Stacked right-hand sides of shape `(D, M, 1)`.
+        tol: Optional absolute singular value cutoff of shape `(D,)`. Pass
+            one when `A` is a residual whose own scale says nothing about
+            numerical rank, e.g. predictors residualized on a baseline.
+
+    Returns:
+        Array of shape `(D,)` with the projected squared norms.
+    """
+    rtol = max(A.shape[-2:]) * np.finfo(float).eps
+    Qa, Ra = _qr_economic(A)
+    coef = (np.swapaxes(Qa, -1, -2) @ r)[..., 0]
+    out = np.sum(coef * coef, axis=-1)
+    diag = np.abs(np.diagonal(Ra, axis1=-2, axis2=-1))
+    deficient = np.flatnonzero(np.min(diag, axis=-1) <= (rtol * np.max(diag, axis=-1) if tol is None else tol))
+    if deficient.size:
+        U, sv, _ = np.linalg.svd(A[deficient], full_matrices=False)
+        cut = rtol * sv[..., :1] if tol is None else tol[deficient, None]
+        coef = (np.swapaxes(U, -1, -2) @ r[deficient])[..., 0]
+        out[deficient] = np.sum(np.where(sv > cut, coef * coef, 0.0), axis=-1)
+    return out
+
+
+def _partial_r2_two_stage(design: np.ndarray, nb: int, ratio: bool = True) -> np.ndarray:
+    """Partial R² by explicit baseline residualization.
+
+    Residualizes the target and the additional predictors on the baseline,
+    then projects the target residual onto the residualized predictors via
+    [`_proj_sq_norm`][ldtc.lmeas.estimators._proj_sq_norm]. Both steps
+    drop numerically null directions with the `np.linalg.lstsq` cutoff,
+    the second one measured against the full `[baseline | additional]`
+    design, so rank-deficient and wide designs are handled.
+
+    Args:
+        design: Stacked blocks `[baseline | additional | target]` of shape
+            `(D, M, K + 1)`.
+        nb: Number of baseline columns.
+        ratio: If `False`, return the numerator and denominator instead of
+            the clipped ratio.
+
+    Returns:
+        Array of shape `(D,)` with the partial R², or a `(2, D)` array of
+        `(num, denom)` when `ratio` is `False`.
+    """
+    y = design[..., -1:]
+    B = design[..., :nb]
+    Qb, Rb = _qr_economic(B)
+    # A rank-deficient baseline leaves arbitrary directions in Qb; project
+    # onto the numerical column space from an SVD instead
+    rtol = max(B.shape[-2:]) * np.finfo(float).eps
+    diag = np.abs(np.diagonal(Rb, axis1=-2, axis2=-1))
+    deficient = np.flatnonzero(np.min(diag, axis=-1) <= rtol * np.max(diag, axis=-1))
+    if deficient.size:
+        U, sv, _ = np.linalg.svd(B[deficient], full_matrices=False)
+        Qb[deficient] = U * (sv > rtol * sv[..., :1])[..., None, :]
+    QbT = np.swapaxes(Qb, -1, -2)
+    r = y - Qb @ (QbT @ y)
+    A_add = design[..., nb:-1]
+    A_perp = A_add - Qb @ (QbT @ A_add)
+    # Sources lying in the baseline's span leave only rounding residue in
+    # A_perp, so its numerical rank is judged against the unresidualized
+    # [baseline | additional] design, as lstsq on the full model would
+    full = design[..., :-1]
+    tol = max(full.shape[-2:]) * np.finfo(float).eps * np.linalg.norm(full, ord=2, axis=(-2, -1))
+    denom = np.sum(r * r, axis=(-2, -1)) + 1e-12
+    num = _proj_sq_norm(A_perp, r, tol=tol)
+    if not ratio:
+        return np.stack([num, denom])
+    return np.clip(num / denom, 0.0, 1.0)
+
+
+def _partial_r2_batch(
+    X: np.ndarray,
+    Y: np.ndarray,
+    p: int,
+    add_sources: Sequence[int],
+    base_sources: Sequence[int],
+    targets: Sequence[int],
+    n_jobs: int = 1,
+) -> np.ndarray:
+    """Mean partial R² improvement from a stack of lag designs.
+
+    Core of
+    [`_dir_influence_linear_conditional_batch`][ldtc.lmeas.estimators._dir_influence_linear_conditional_batch]
+    once the lag design is built; see there for the estimator itself.
+
+    Args:
+        X: Lag designs of shape `(D, M, N*p)` laid out as by
+            [`_lag_matrix`][ldtc.lmeas.estimators._lag_matrix].
+        Y: Aligned targets of shape `(D, M, N)`.
+        p: Number of lags in `X`.
+        add_sources: Indices of candidate source signals to add.
+        base_sources: Indices included in the baseline model (besides the
+            target's own AR lags).
+        targets: Target signal indices to evaluate.
+        n_jobs: Number of joblib worker threads across targets.
+
+    Returns:
+        Array of shape `(D,)` with the mean partial R² improvement across
+        `targets` for each design.
+    """
+    D = X.shape[0]
+    Nsig = Y.shape[-1]
+
+    lag_offsets = np.arange(p, dtype=np.intp)[:, None] * Nsig
+
+    def cols_for(indices: Sequence[int]) -> np.ndarray:
+        # Lag-major column indices of `indices` in X, without a Python loop
+        return (np.asarray(indices, dtype=np.intp)[None, :] + lag_offsets).ravel()
+
+    # Targets whose baseline and additional predictor sets coincide (e.g.,
+    # every target of L_ex, whose baseline is C itself) share one
+    # factorization, with all of their y columns appended to the block
+    groups: Dict[Tuple[Tuple[int, ...], Tuple[int, ...]], List[int]] = {}
+    for t in targets:
+        key = (tuple(sorted({t, *base_sources})), tuple(s for s in add_sources if s != t))
+        groups.setdefault(key, []).append(t)
+
+    def group_r2(tgts: Sequence[int]) -> np.ndarray:
+        # Exclude the target from add/base sources to avoid self-lag duplication
+        t0 = tgts[0]
+        base_eff = [s for s in base_sources if s != t0]
+        add_eff = [s for s in add_sources if s != t0]
+        cols_base = np.concatenate([cols_for([t0]), cols_for(base_eff)])
+        cols_add = cols_for(add_eff)
+        g = len(tgts)
+        if not cols_add.size:
+            return np.zeros((D, g))
+        # One gather per group into a [baseline | additional | targets] block
+        design = np.concatenate([X[..., np.concatenate([cols_base, cols_add])], Y[..., list(tgts)]], axis=-1)
+        nb = cols_base.size
+        K = design.shape[-1] - g
+        M = design.shape[-2]
+
+        def single(i: int, rows: np.ndarray | slice = slice(None)) -> np.ndarray:
+            # [baseline | additional | y_i] for the two-stage path
+            return np.concatenate([design[rows, :, :K], design[rows, :, K + i : K + i + 1]], axis=-1)
+
+        if M <= K:
+            return np.stack([_partial_r2_two_stage(single(i), nb) for i in range(g)], axis=-1)
+        # A single QR of the block splits each Qᵀy into the parts of y
+        # explained by the baseline (rows < nb), by the additional block on
+        # top of it (rows nb..K-1), and the residual (rows >= K); Q is
+        # orthogonal, so every R column keeps the norm of its y
+        R = _qr_r(design)
+        z = R[..., :, K:]
+        num = np.sum(z[..., nb:K, :] ** 2, axis=-2)
+        denom = np.sum(z[..., nb:, :] ** 2, axis=-2) + 1e-12
+        # Rank-deficient draws need the lstsq-style cutoff of the two-stage path
+        diag = np.abs(np.diagonal(R[..., :, :K], axis1=-2, axis2=-1))
+        deficient = np.flatnonzero(np.min(diag, axis=-1) <= max(M, K) * np.finfo(float).eps * np.max(diag, axis=-1))
+        if deficient.size:
+            for i in range(g):
+                num[deficient, i], denom[deficient, i] = _partial_r2_two_stage(single(i, deficient), nb, ratio=False)
+        return np.clip(num / denom, 0.0, 1.0)
+
+    members = list(groups.values())
+    if n_jobs == 1 or len(members) < 2:
+        parts = [group_r2(tgts) for tgts in members]
+    else:
+        parts = Parallel(n_jobs=n_jobs, prefer="threads")(delayed(group_r2)(tgts) for tgts in members)
+    by_target = {t: part[:, i] for tgts, part in zip(members, parts) for i, t in enumerate(tgts)}
+    r2_improvements = [by_target[t] for t in targets]
+    return np.mean(r2_improvements, axis=0) if len(targets) else np.zeros(D)
+
+
+def _dir_influence_linear_conditional_batch(
+    xb: np.ndarray,
+    p: int,
+    add_sources: Sequence[int],
+    base_sources: Sequence[int],
+    targets: Sequence[int],
+    n_jobs: int = 1,
+) -> np.ndarray:
+    """Batched partial R² improvement over a stack of series.
+
+    Same estimator as
+    [`_dir_influence_linear_conditional`][ldtc.lmeas.estimators._dir_influence_linear_conditional],
+    evaluated for every series in `xb` at once. Column selection is done
+    once for the whole stack and the QR residualization runs as stacked
+    LAPACK calls, so bootstrap replicates cost one batched factorization
+    per target instead of one Python-level re-fit per draw.
+
+    Args:
+        xb: Array of shape `(D, T, N)`; each `xb[d]` is a time-major series.
+        p: Number of lags for the linear model.
+        add_sources: Indices of candidate source signals to add.
+        base_sources: Indices included in the baseline model (besides the
+            target's own AR lags).
+        targets: Target signal indices to evaluate.
+        n_jobs: Number of joblib worker threads across targets; `1` runs
+            serially. Threads suffice because LAPACK releases the GIL.
+
+    Returns:
+        Array of shape `(D,)` with the mean partial R² improvement across
+        `targets` for each series.
+    """
+    X, Y = _lag_matrix(xb, p)
+    return _partial_r2_batch(X, Y, p, add_sources, base_sources, targets, n_jobs=n_jobs)
+
+
 def _dir_influence_linear_conditional(
     x: np.ndarray,
     p: int,
     add_sources: Sequence[int],
     base_sources: Sequence[int],
     targets: Sequence[int],
+    n_jobs: int = 1,
 ) -> float:
     """Partial R² improvement from additional lagged sources to targets.
 
@@ -111,56 +383,83 @@ def _dir_influence_linear_conditional(
         base_sources: Indices included in the baseline model (besides the
             target's own AR lags).
         targets: Target signal indices to evaluate.
+        n_jobs: Number of joblib worker threads across targets.
 
     Returns:
         Mean partial R² improvement across `targets`.
     """
-    X, Y = _lag_matrix(x, p)
-    Tm, N = Y.shape
-    Nsig = N
+    vals = _dir_influence_linear_conditional_batch(x[None], p, add_sources, base_sources, targets, n_jobs=n_jobs)
+    return float(vals[0])
 
-    def cols_for(indices: Sequence[int]) -> List[int]:
-        out: List[int] = []
-        idx_arr = np.array(indices, dtype=int)
-        for lag in range(p):
-            out.extend((idx_arr + lag * Nsig).tolist())
-        return out
 
-    r2_improvements = []
-    for t in targets:
-        cols_ar = np.array(cols_for([t]), dtype=int)
-        # Exclude the target from add/base sources to avoid self-lag duplication
-        base_eff = [s for s in base_sources if s != t]
-        add_eff = [s for s in add_sources if s != t]
-        cols_base = np.array(cols_for(base_eff), dtype=int) if len(base_eff) else np.array([], dtype=int)
-        cols_add = np.array(cols_for(add_eff), dtype=int) if len(add_eff) else np.array([], dtype=int)
-        # Build baseline and additional predictor matrices
-        X_base = np.concatenate([X[:, cols_ar], X[:, cols_base]], axis=1) if len(cols_base) else X[:, cols_ar]
-        A_add = X[:, cols_add] if len(cols_add) else np.zeros((X.shape[0], 0))
-        y = Y[:, t]
-        # Compute partial R^2 of add predictors given baseline using QR residualization
-        if X_base.size == 0:
-            # Should not occur; fallback to variance about mean
-            r = y - np.mean(y)
-            A_perp = A_add
-        else:
-            Qb, _ = np.linalg.qr(X_base, mode="reduced")
-            yhat_b = Qb @ (Qb.T @ y)
-            r = y - yhat_b
-            if A_add.size:
-                A_perp = A_add - Qb @ (Qb.T @ A_add)
-            else:
-                A_perp = A_add
-        denom = float(np.sum(r * r)) + 1e-12
-        if A_perp.size == 0:
-            r2_add = 0.0
-        else:
-            beta_add, *_ = np.linalg.lstsq(A_perp, r, rcond=None)
-            rhat = A_perp @ beta_add
-            num = float(np.sum(rhat * rhat))
-            r2_add = max(0.0, min(1.0, num / denom))
-        r2_improvements.append(r2_add)
-    return float(np.mean(r2_improvements)) if r2_improvements else 0.0
+def _linear_loop_scorer(x: np.ndarray, p: int) -> Callable[[Sequence[int]], float]:
+    """Point-estimate `L_loop` scorer for many partitions of one window.
+
+    Forms the Gram matrix of the augmented lag design `[X | Y]` once and
+    returns a function computing the linear `L_loop` of
+    [`estimate_L`][ldtc.lmeas.estimators.estimate_L] for a given `C`
+    (with `Ex` its complement). For each target, the Cholesky factor of
+    the Gram block ordered `[baseline | additional | y]` is the transpose
+    of the `R` factor used by the estimator, so its last row yields the
+    same partial R². One call costs one stacked Cholesky of
+    `(N*p + 1)`-square blocks, which suits greedy partition search.
+
+    Normal equations square the condition number, so a candidate whose
+    columns are collinear, or close to it, is rescored with the
+    estimator's own QR path on the raw window. That path applies the
+    estimator's numerical-rank rule, under which added columns lying in
+    the baseline's span explain nothing.
+
+    Args:
+        x: Array of shape `(T, N)`, time major.
+        p: Number of lags for the linear model.
+
+    Returns:
+        Callable mapping loop indices `C` to the `L_loop` point estimate.
+    """
+    X, Y = _lag_matrix(x, p)
+    Z = np.concatenate([X, Y], axis=-1)
+    G = Z.T @ Z
+    N = int(x.shape[1])
+    K = N * p
+    lag_offsets = np.arange(p, dtype=np.intp)[:, None] * N
+    # Cholesky diagonals carry relative errors of about eps / ratio², so a
+    # ratio of eps**0.25 keeps the fast path within ~sqrt(eps) of QR
+    cutoff = np.finfo(float).eps ** 0.25
+
+    def cols_for(indices: Sequence[int]) -> np.ndarray:
+        return (np.asarray(indices, dtype=np.intp)[None, :] + lag_offsets).ravel()
+
+    def qr_score(C: List[int], Ex: List[int]) -> float:
+        # The estimator's own point estimate, hence its rank rule
+        return _dir_influence_linear_conditional(x, p, add_sources=C, base_sources=Ex, targets=C)
+
+    def score(C: Sequence[int]) -> float:
+        C = list(C)
+        C_set = set(C)
+        Ex = [i for i in range(N) if i not in C_set]
+        if len(C) < 2:
+            # No additional sources for any target
+            return 0.0
+        # Per target: lag columns of the baseline [t, Ex], of C without t, then y_t
+        ex_cols = cols_for(Ex)
+        idx = np.stack(
+            [np.concatenate([cols_for([t]), ex_cols, cols_for([s for s in C if s != t]), [K + t]]) for t in C]
+        )
+        nb = p * (1 + len(Ex))
+        try:
+            L = np.linalg.cholesky(G[idx[:, :, None], idx[:, None, :]])
+        except np.linalg.LinAlgError:
+            return qr_score(C, Ex)
+        diag = np.diagonal(L, axis1=-2, axis2=-1)[:, :K]
+        if np.any(np.min(diag, axis=-1) <= cutoff * np.max(diag, axis=-1)):
+            return qr_score(C, Ex)
+        z = L[:, K, :]
+        num = np.sum(z[:, nb:K] ** 2, axis=-1)
+        denom = np.sum(z[:, nb:] ** 2, axis=-1) + 1e-12
+        return float(np.mean(np.clip(num / denom, 0.0, 1.0)))
+
+    return score
 
 
 def _dir_influence_linear(x: np.ndarray, p: int, sources: Sequence[int], targets: Sequence[int]) -> float:
@@ -178,7 +477,13 @@ def _dir_influence_mi(x: np.ndarray, sources: Sequence[int], targets: Sequence[i
     """Average pairwise mutual information from sources to targets.
 
     Computes MI between `sources` at time `t-lag` and `targets` at time `t`
-    using scikit-learn's kNN-based estimator.
+    with the KSG estimator under scikit-learn's `mutual_info_regression`
+    defaults: each lagged column is scaled to unit variance and jittered
+    by a relative `1e-10`, `k = 3`, and the k-th neighbor distance is
+    shrunk by one ulp rather than an absolute epsilon, so tied samples
+    separated only by the jitter keep their marginal counts.
+    Marginals are sorted once per source and per target and shared across
+    all pairs.
 
     Args:
         x: Array of shape `(T, N)`, time major.
@@ -192,29 +497,59 @@ def _dir_influence_mi(x: np.ndarray, sources: Sequence[int], targets: Sequence[i
     T, N = x.shape
     if T <= lag:
         return 0.0
+
+    def _unit_var(a: np.ndarray) -> np.ndarray:
+        sd = np.std(a, axis=0)
+        a = a / np.where(sd > 0.0, sd, 1.0)
+        # Tiny jitter breaks ties (e.g., rows repeated by block resampling), as in sklearn
+        return a + 1e-10 * np.maximum(1.0, np.mean(np.abs(a), axis=0)) * np.random.standard_normal(a.shape)
+
+    past = _unit_var(np.asarray(x[:-lag], dtype=float))
+    present = _unit_var(np.asarray(x[lag:], dtype=float))
+    src_sorted: Dict[int, np.ndarray] = {}
     vals: List[float] = []
     for t in targets:
-        y = x[lag:, t]
+        y = present[:, t]
+        y_sorted = np.sort(y)
         for s in sources:
             if s == t:
                 continue
-            xs = x[:-lag, s]
-            # sklearn MI expects 2D X
-            mi = mutual_info_regression(xs.reshape(-1, 1), y, discrete_features=False)
-            vals.append(float(mi[0]))
+            xs = past[:, s]
+            if s not in src_sorted:
+                src_sorted[s] = np.sort(xs)
+            vals.append(_mi_ksg(xs, y, k=3, x_sorted=src_sorted[s], y_sorted=y_sorted, eps=None))
     return float(np.mean(vals)) if vals else 0.0
 
 
-def _mi_ksg(x: np.ndarray, y: np.ndarray, k: int = 5) -> float:
+def _mi_ksg(
+    x: np.ndarray,
+    y: np.ndarray,
+    k: int = 5,
+    x_sorted: np.ndarray | None = None,
+    y_sorted: np.ndarray | None = None,
+    workers: int = 1,
+    eps: float | None = 1e-10,
+) -> float:
     """Kraskov, Stögbauer, and Grassberger (KSG-I) mutual information.
 
     Estimates MI between two continuous variables using k-nearest neighbors
-    with the Chebyshev (max-norm) metric.
+    with the Chebyshev (max-norm) metric. The joint k-NN search uses a
+    kd-tree; the marginals are one-dimensional, so their neighbor counts
+    come from binary searches on the sorted values.
 
     Args:
         x: Array-like, coerced to shape `(T, 1)`.
         y: Array-like, coerced to shape `(T, 1)`.
         k: Neighborhood size for KSG (default 5).
+        x_sorted: Optional `np.sort(x)`, reused when the same marginal
+            appears in several pairs.
+        y_sorted: Optional `np.sort(y)`.
+        workers: Threads for the joint k-NN query (`-1` uses all cores),
+            as in `cKDTree.query`.
+        eps: Absolute amount by which the k-th neighbor distance is shrunk
+            so marginal counts are strictly inside it. `None` steps to the
+            next float toward zero instead, as scikit-learn does; use it
+            when the inputs carry a jitter on the order of `eps`.
 
     Returns:
         Estimated mutual information in nats.
@@ -227,32 +562,63 @@ def _mi_ksg(x: np.ndarray, y: np.ndarray, k: int = 5) -> float:
     if n <= k:
         return 0.0
     # Joint tree with Chebyshev metric (max-norm)
-    joint = np.hstack([x, y])
+    joint = np.empty((n, 2))
+    joint[:, 0] = x[:, 0]
+    joint[:, 1] = y[:, 0]
     tree_joint = cKDTree(joint, leafsize=32)
     # Distances to k-th neighbor (exclude the point itself by k+1 in query)
-    # Use a tiny epsilon to ensure strictly inside counts on marginals
-    eps = 1e-10
-    dists, _ = tree_joint.query(joint, k=k + 1, p=np.inf)
-    rk = np.maximum(dists[:, -1] - eps, 0.0)
-    # Marginal counts within Chebyshev radius rk
-    tree_x = cKDTree(x, leafsize=32)
-    tree_y = cKDTree(y, leafsize=32)
-    nx = np.fromiter(
-        (len(tree_x.query_ball_point(x[i], rk[i], p=np.inf)) - 1 for i in range(n)),
-        dtype=int,
-    )
-    ny = np.fromiter(
-        (len(tree_y.query_ball_point(y[i], rk[i], p=np.inf)) - 1 for i in range(n)),
-        dtype=int,
-    )
+    # Shrink the radius so marginal counts are strictly inside it
+    dists, _ = tree_joint.query(joint, k=k + 1, p=np.inf, workers=workers)
+    rk = np.nextafter(dists[:, -1], 0.0) if eps is None else np.maximum(dists[:, -1] - eps, 0.0)
+    # Marginal counts within Chebyshev radius rk (excluding the point itself)
+    nx = _count_within(np.sort(x[:, 0]) if x_sorted is None else x_sorted, x[:, 0], rk) - 1
+    ny = _count_within(np.sort(y[:, 0]) if y_sorted is None else y_sorted, y[:, 0], rk) - 1
     # Guard against degenerate neighborhoods (clip to >=0)
     nx = np.clip(nx, 0, None)
     ny = np.clip(ny, 0, None)
-    # KSG I estimator
-    val = digamma(k) + digamma(n) - np.mean(digamma(nx + 1) + digamma(ny + 1))
+    # KSG I estimator; counts are integers in [0, n - 1], so digamma is a lookup
+    psi = _digamma_table(n)
+    val = psi[k - 1] + psi[n - 1] - np.mean(psi[nx] + psi[ny])
     return float(max(0.0, val))
 
 
+def _count_within(sorted_vals: np.ndarray, v: np.ndarray, r: np.ndarray) -> np.ndarray:
+    """Count entries of `sorted_vals` within `[v - r, v + r]`, elementwise.
+
+    One-dimensional equivalent of a `cKDTree.query_ball_point(...,
+    return_length=True)` ball count, using two vectorized binary searches.
+    """
+    n = sorted_vals.shape[0]
+    hi = np.searchsorted(sorted_vals, v + r, side="right")
+    lo = np.searchsorted(sorted_vals, v - r, side="left")
+    # `v ± r` is rounded, which can put a sample at distance just above `r`
+    # inside the bounds (or one just below it outside); step each edge until
+    # it agrees with the distance test `|s - v| <= r` a k-d tree would apply
+    while True:
+        out = np.flatnonzero((hi > 0) & (sorted_vals[np.maximum(hi - 1, 0)] - v > r))
+        inn = np.flatnonzero((hi < n) & (sorted_vals[np.minimum(hi, n - 1)] - v <= r))
+        if not (out.size or inn.size):
+            break
+        hi[out] -= 1
+        hi[inn] += 1
+    while True:
+        out = np.flatnonzero((lo < n) & (v - sorted_vals[np.minimum(lo, n - 1)] > r))
+        inn = np.flatnonzero((lo > 0) & (v - sorted_vals[np.maximum(lo - 1, 0)] <= r))
+        if not (out.size or inn.size):
+            break
+        lo[out] += 1
+        lo[inn] -= 1
+    return hi - lo
+
+
+@lru_cache(maxsize=8)
+def _digamma_table(n: int) -> np.ndarray:
+    """Read-only table of `digamma(1), ..., digamma(n)`, so `psi[m - 1] == digamma(m)`."""
+    psi = digamma(np.arange(1, n + 1, dtype=float))
+    psi.setflags(write=False)
+    return psi
+
+
 def _dir_influence_mi_kraskov(
     x: np.ndarray,
     sources: Sequence[int],
@@ -262,6 +628,10 @@ def _dir_influence_mi_kraskov(
 ) -> float:
     """Average pairwise KSG MI from sources to targets.
 
+    Marginals are sorted once per source and per target and shared across
+    all pairs. Long windows (at least `_KSG_THREADED_MIN_T` samples)
+    spread the joint k-NN queries over all cores.
+
     Args:
         x: Array of shape `(T, N)`, time major.
         sources: Indices of source signals.
@@ -275,22 +645,31 @@ def _dir_influence_mi_kraskov(
     T, N = x.shape
     if T <= lag:
         return 0.0
+    workers = -1 if T >= _KSG_THREADED_MIN_T else 1
+    past = np.asarray(x[:-lag], dtype=float)
+    present = np.asarray(x[lag:], dtype=float)
+    src_sorted: Dict[int, np.ndarray] = {}
     vals: List[float] = []
     for t in targets:
-        y = x[lag:, t]
+        y = present[:, t]
+        y_sorted = np.sort(y)
         for s in sources:
             if s == t:
                 continue
-            xs = x[:-lag, s]
-            vals.append(_mi_ksg(xs, y, k=k))
+            xs = past[:, s]
+            if s not in src_sorted:
+                src_sorted[s] = np.sort(xs)
+            vals.append(_mi_ksg(xs, y, k=k, x_sorted=src_sorted[s], y_sorted=y_sorted, workers=workers))
     return float(np.mean(vals)) if vals else 0.0
 
 
+@lru_cache(maxsize=1)
 def _maybe_te_backend() -> Callable[[np.ndarray, Sequence[int], Sequence[int], int], float] | None:
     """Optionally provide a transfer-entropy-like backend.
 
     Tries to import a light-weight proxy using `tigramite`. If available,
     returns a callable `te(arr, sources, targets, lag)`; otherwise `None`.
+    The lookup runs once per process; later calls return the cached result.
     """
     # Placeholder: detect tigramite and use its ParCorr-based CMI TE if present.
     try:
@@ -308,31 +687,25 @@ def _maybe_te_backend() -> Callable[[np.ndarray, Sequence[int], Sequence[int], i
                 return 0.0
             dataframe = pp.DataFrame(arr, datatime=None)
             pcmci = pcmci_mod.PCMCI(dataframe=dataframe, cond_ind_test=ParCorr())
-            # Run partial correlation at lag; approximate TE by partial correlation magnitude
-            vals: List[float] = []
-            for t in targets:
-                for s in sources:
-                    if s == t:
-                        continue
-                    # Run partial correlation test X_{t-lag} -> Y_t | Y_{t-1}
-                    res = pcmci.get_lagged_dependencies(
-                        selected_variables=[t],
-                        tau_max=lag,
-                        val_only=True,
-                    )
-                    # Extract score if present
-                    try:
-                        score = abs(float(res["val_matrix"][t, s, lag]))
-                    except Exception:
-                        score = 0.0
-                    vals.append(score)
-            return float(np.mean(vals)) if vals else 0.0
+            # Run partial correlation at lag; approximate TE by partial correlation magnitude.
+            # One call covers every link; val_matrix[i, j, tau] scores X^i_{t-tau} -> X^j_t.
+            try:
+                res = pcmci.get_lagged_dependencies(tau_max=lag, val_only=True)
+                scores = np.abs(np.asarray(res["val_matrix"], dtype=float)[:, :, lag])
+            except Exception:
+                return 0.0
+            src = np.asarray(sources, dtype=int)
+            tgt = np.asarray(targets, dtype=int)
+            block = scores[np.ix_(src, tgt)]
+            off_diag = src[:, None] != tgt[None, :]
+            return float(np.mean(block[off_diag])) if off_diag.any() else 0.0
 
         return te_fn
     except Exception:
         return None
 
 
+@lru_cache(maxsize=1)
 def _maybe_di_backend() -> Callable[[np.ndarray, Sequence[int], Sequence[int], int], float] | None:
     """Optionally provide a directed-information backend.
 
@@ -347,6 +720,9 @@ def _bootstrap(
     fn: Callable[[np.ndarray], float],
     n_draws: int = 64,
     block: int | None = None,
+    batch_fn: Callable[[np.ndarray], np.ndarray] | None = None,
+    n_jobs: int = 1,
+    idxs: Sequence[np.ndarray] | None = None,
 ) -> Tuple[float, float]:
     """Bootstrap confidence interval (percentile, ~95%).
 
@@ -360,22 +736,52 @@ def _bootstrap(
         fn: Estimator function mapping an array like `x[idx]` to a scalar.
         n_draws: Number of bootstrap replicates.
         block: Block length; defaults to `max(4, T // 4)`.
+        batch_fn: Optional vectorized form of `fn`. When given, all
+            replicates are gathered into one `(n_draws, T, ...)` array and
+            evaluated in a single call that returns `n_draws` values.
+        n_jobs: Number of joblib workers; `1` runs serially. Batched chunks
+            go to threads (the work is in LAPACK); per-draw `fn` calls go
+            to worker processes, which also covers pure-Python estimators.
+        idxs: Optional precomputed resampling indices (one array of length
+            `T` per draw). Passing the same draws to several metrics makes
+            their CIs paired; `n_draws` and `block` are then ignored.
 
     Returns:
         Tuple of `(lo, hi)` percentile CI bounds.
     """
     T = x.shape[0]
-    if T < 12:
+    if T < 12 or (idxs is None and n_draws <= 0):
         return (np.nan, np.nan)
-    # Default block length ~ window/4, with a small floor
-    blk = int(block) if block is not None else max(4, T // 4)
-    idxs = block_bootstrap_indices(T, blk, n_draws)
-    vals: List[float] = []
-    for idx in idxs:
-        vals.append(fn(x[idx]))
-    arr = np.asarray(vals, dtype=float)
-    lo, hi = np.nanpercentile(arr, [2.5, 97.5]).tolist()
-    return lo, hi
+    if idxs is None:
+        # Default block length ~ window/4, with a small floor
+        blk = int(block) if block is not None else max(4, T // 4)
+        idxs = block_bootstrap_indices(T, blk, n_draws)
+    arr = np.empty(len(idxs), dtype=np.float64)
+    if batch_fn is not None and idxs:
+        idx_arr = np.stack(idxs)
+        # Evaluate replicates in chunks so the gathered stack stays cache-sized
+        step = max(1, _BOOT_BATCH_ELEMS // max(1, x[0].size * T))
+        starts = range(0, len(idxs), step)
+        if n_jobs == 1:
+            for i in starts:
+                arr[i : i + step] = batch_fn(x[idx_arr[i : i + step]])
+        else:
+            parts = Parallel(n_jobs=n_jobs, prefer="threads")(
+                delayed(batch_fn)(x[idx_arr[i : i + step]]) for i in starts
+            )
+            for i, v in zip(starts, parts):
+                arr[i : i + step] = v
+    elif n_jobs == 1:
+        for i, idx in enumerate(idxs):
+            arr[i] = fn(x[idx])
+    else:
+        arr[:] = Parallel(n_jobs=n_jobs)(delayed(fn)(x[idx]) for idx in idxs)
+    # Drop failed (NaN) replicates up front so the plain percentile applies
+    arr = arr[~np.isnan(arr)]
+    if arr.size == 0:
+        return (np.nan, np.nan)
+    lo, hi = np.percentile(arr, [2.5, 97.5])
+    return float(lo), float(hi)
 
 
 def estimate_L(
@@ -387,14 +793,16 @@ def estimate_L(
     lag_mi: int = 1,
     n_boot: int = 64,
     mi_k: int = 5,
+    n_jobs: int = 1,
+    seed: int | None = None,
 ) -> LResult:
     """Estimate loop and exchange influence.
 
     Computes `L_loop` over partition `C` and `L_ex` from `Ex -> C` using the
     selected predictive-dependence metric, then attaches a percentile
     bootstrap CI for both. The linear estimator uses an AR + lagged-source
-    partial-R² scheme; the MI variants use either scikit-learn or a Kraskov
-    KSG-I estimator.
+    partial-R² scheme; the MI variants use a KSG-I estimator, either with
+    scikit-learn's defaults or with a configurable `k`.
 
     Args:
         X: Time-by-signal matrix of shape `(T, N)`.
@@ -406,8 +814,16 @@ def estimate_L(
             installed.
         p: VAR order for the linear estimator.
         lag_mi: Lag between sources and targets for MI, TE, and DI methods.
-        n_boot: Number of bootstrap draws for CI estimation.
+        n_boot: Number of bootstrap draws for CI estimation. `0` skips the
+            bootstrap and reports `(nan, nan)` CIs.
         mi_k: k-NN parameter for Kraskov MI.
+        n_jobs: Number of joblib workers for the linear estimator's targets
+            and for bootstrap replicates (`-1` uses all cores). The default
+            `1` keeps everything in the calling thread, which suits the
+            per-window real-time loop.
+        seed: Optional seed for the bootstrap draws. With a seed, repeated
+            calls on windows of the same length reuse cached indices. Both
+            metrics are always resampled with the same draws.
 
     Returns:
         An [`LResult`][ldtc.lmeas.estimators.LResult] with point estimates and
@@ -439,16 +855,22 @@ def estimate_L(
     C = list(C)
     Ex = list(Ex)
     # N = X.shape[1]
+    Lloop_batch: Callable[[np.ndarray], np.ndarray] | None = None
+    Lex_batch: Callable[[np.ndarray], np.ndarray] | None = None
     # Targets are nodes in C
     if method == "linear":
 
         def Lloop_fn(arr: np.ndarray) -> float:
             # Condition on Ex when assessing loop influence
-            return _dir_influence_linear_conditional(arr, p=p, add_sources=C, base_sources=Ex, targets=C)
+            return _dir_influence_linear_conditional(arr, p=p, add_sources=C, base_sources=Ex, targets=C, n_jobs=n_jobs)
 
         def Lex_fn(arr: np.ndarray) -> float:
             # Condition on C when assessing exchange influence
-            return _dir_influence_linear_conditional(arr, p=p, add_sources=Ex, base_sources=C, targets=C)
+            return _dir_influence_linear_conditional(arr, p=p, add_sources=Ex, base_sources=C, targets=C, n_jobs=n_jobs)
+
+        # Vectorized forms evaluate all bootstrap replicates in one call
+        Lloop_batch = partial(_dir_influence_linear_conditional_batch, p=p, add_sources=C, base_sources=Ex, targets=C)
+        Lex_batch = partial(_dir_influence_linear_conditional_batch, p=p, add_sources=Ex, base_sources=C, targets=C)
 
     elif method == "mi":
 
@@ -498,8 +920,15 @@ def estimate_L(
 
     L_loop = float(Lloop_fn(X))
     L_ex = float(Lex_fn(X))
-    ci_loop = _bootstrap(X, Lloop_fn, n_draws=n_boot)
-    ci_ex = _bootstrap(X, Lex_fn, n_draws=n_boot)
+    T = X.shape[0]
+    if n_boot <= 0 or T < 12:
+        # Point estimates only (e.g., candidate scoring); no CI to report
+        ci_loop = ci_ex = (np.nan, np.nan)
+    else:
+        # Draw the resampling indices once so both CIs come from paired replicates
+        idxs = block_bootstrap_indices(T, max(4, T // 4), n_boot, seed=seed)
+        ci_loop = _bootstrap(X, Lloop_fn, n_draws=n_boot, batch_fn=Lloop_batch, n_jobs=n_jobs, idxs=idxs)
+        ci_ex = _bootstrap(X, Lex_fn, n_draws=n_boot, batch_fn=Lex_batch, n_jobs=n_jobs, idxs=idxs)
     if marginal:
         # Inflate CIs to signal uncertainty and allow smell-tests to invalidate
         try:
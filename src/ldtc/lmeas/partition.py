@@ -16,8 +16,11 @@ See Also:
 
 from __future__ import annotations
 
+import bisect
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 
 @dataclass
@@ -61,18 +64,35 @@ class PartitionManager:
                 `Ex`.
         """
         self._N = int(N_signals)
-        all_idxs = list(range(self._N))
-        C = list(sorted(set(seed_C)))
-        Ex = [i for i in all_idxs if i not in C]
+        # Set view of part.C for O(1) membership and order-free comparison
+        self._C_set = frozenset(seed_C)
+        # Per-node membership mask (1 = in C); Ex is built once from it and
+        # then patched on each accepted flip
+        self._mask = bytearray(self._N)
+        self._set_mask(self._C_set, 1)
+        C = sorted(self._C_set)
+        # Exactly-sized: flatnonzero counts first, then fills one buffer
+        Ex = np.flatnonzero(np.frombuffer(self._mask, dtype=np.uint8) == 0).tolist()
         self.part = Partition(C=C, Ex=Ex, frozen=False, flips=0)
         # Hysteresis state
-        self._pending_C: Optional[List[int]] = None
+        # Pending suggestion as a frozenset: order-free, hash cached after first use
+        self._pending_C: Optional[frozenset[int]] = None
         self._pending_streak: int = 0
+        # Raw input of the last call when it was a no-change call; an immediate
+        # repeat skips the set build (cleared by any other call)
+        self._noop_key: Optional[Tuple[int, ...]] = None
         self._last_M_db: Optional[float] = None
         # Provenance of the last accepted flip (for audit provenance)
         # Keys: {"streak": int, "delta_M_db": float, "new_C": List[int]}
         self.last_flip_info: Optional[dict] = None
 
+    def _set_mask(self, indices: Iterable[int], flag: int) -> None:
+        """Set the membership mask to `flag` for in-range `indices`."""
+        mask = self._mask
+        for i in indices:
+            if 0 <= i < self._N:
+                mask[i] = flag
+
     def get(self) -> Partition:
         """Return the current partition state.
 
@@ -122,21 +142,29 @@ class PartitionManager:
         """
         if self.part.frozen:
             return
-        newC = list(sorted(set(suggested_C)))
-        if newC == self.part.C:
+        key = tuple(suggested_C)
+        if key == self._noop_key:
+            # Repeat of the previous no-change call; state is already reset
+            return
+        newC_set = frozenset(key)
+        if newC_set == self._C_set:
             # No change requested; reset pending streak
             self._pending_C = None
             self._pending_streak = 0
+            self._noop_key = key
             return
+        self._noop_key = None
         # Evaluate hysteresis: require sufficient ΔM and persistence
-        if delta_M_db >= delta_M_min_db and (self._pending_C == newC or self._pending_C is None):
-            self._pending_C = newC
+        if delta_M_db >= delta_M_min_db and (self._pending_C is None or self._pending_C == newC_set):
+            self._pending_C = newC_set
             self._pending_streak += 1
         else:
             # Either insufficient gain or a different suggestion arrived; reset
-            self._pending_C = newC
+            self._pending_C = newC_set
             self._pending_streak = 1 if delta_M_db >= delta_M_min_db else 0
         if self._pending_streak >= consecutive_required:
+            # Only an accepted flip needs the sorted list
+            newC = sorted(newC_set)
             # Record provenance before state reset
             self.last_flip_info = {
                 "streak": int(self._pending_streak),
@@ -144,8 +172,20 @@ class PartitionManager:
                 "new_C": list(newC),
             }
             self.part.C = newC
-            all_idxs = list(range(self._N))
-            self.part.Ex = [i for i in all_idxs if i not in newC]
+            # Patch Ex with the nodes that changed side: O(|ΔC| log N), not O(N)
+            added = newC_set - self._C_set
+            removed = self._C_set - newC_set
+            Ex = self.part.Ex
+            mask = self._mask
+            for i in added:
+                if 0 <= i < self._N and not mask[i]:
+                    del Ex[bisect.bisect_left(Ex, i)]
+                    mask[i] = 1
+            for i in removed:
+                if 0 <= i < self._N and mask[i]:
+                    bisect.insort(Ex, i)
+                    mask[i] = 0
+            self._C_set = newC_set
             self.part.flips += 1
             # reset pending
             self._pending_C = None
@@ -173,7 +213,12 @@ def greedy_suggest_C(
     from `Ex` that maximizes the penalized gain in `L_loop` until the
     marginal gain falls below `theta` or the cap `kappa` is reached.
     Candidates are evaluated in lexicographic index order so ties break
-    deterministically.
+    deterministically. With the built-in linear
+    [`estimate_L`][ldtc.lmeas.estimators.estimate_L], candidates are scored
+    from a Gram matrix formed once per window instead of re-running the
+    estimator; ill-conditioned candidates, such as a channel duplicating
+    one in `C`, fall back to the estimator itself, so the scores are the
+    same `L_loop` point estimates.
 
     Args:
         X: Telemetry matrix `(T, N)` consumed by `estimator`.
@@ -184,8 +229,9 @@ def greedy_suggest_C(
         method: Estimation method forwarded to `estimator`.
         p: VAR order for the linear estimator.
         lag_mi: Lag for MI-based estimators.
-        n_boot_candidates: Number of bootstrap draws used during candidate
-            evaluation.
+        n_boot_candidates: Number of bootstrap draws used for the baseline
+            and final estimator calls. Candidates are ranked on point
+            estimates alone and skip the bootstrap.
         mi_k: k-NN parameter for Kraskov MI.
         lam: Sparsity penalty per added node.
         theta: Minimum penalized gain required to accept a candidate.
@@ -195,10 +241,19 @@ def greedy_suggest_C(
         A tuple `(suggested_C, delta_M_db, details)` where `details`
         contains provenance about added indices and intermediate gains.
     """
+    from .estimators import _linear_loop_scorer, estimate_L
     from .metrics import m_db as _m_db
 
-    C_cur: List[int] = list(sorted(set(int(i) for i in C)))
-    Ex_cur: List[int] = [i for i in range(int(X.shape[1])) if i not in C_cur]
+    # Candidates only need an L_loop point estimate. For the built-in linear
+    # estimator, score them from the window's Gram matrix; otherwise re-estimate.
+    loop_score: Optional[Callable[[Sequence[int]], float]] = None
+    if estimator is estimate_L and method == "linear":
+        loop_score = _linear_loop_scorer(np.asarray(X, dtype=float), int(p))
+
+    # C_cur and Ex_cur stay sorted; membership checks go through the set
+    C_set = set(int(i) for i in C)
+    C_cur: List[int] = sorted(C_set)
+    Ex_cur: List[int] = [i for i in range(int(X.shape[1])) if i not in C_set]
     # Baseline
     base = estimator(
         X=X,
@@ -226,20 +281,24 @@ def greedy_suggest_C(
         best_idx: Optional[int] = None
         best_L_loop_new: Optional[float] = None
         # Evaluate candidates in lexicographic order for deterministic tie-breaking
-        for ex_idx in sorted(Ex_cur):
-            cand_C = sorted(C_cur + [ex_idx])
-            cand_Ex = [i for i in range(int(X.shape[1])) if i not in cand_C]
-            res = estimator(
-                X=X,
-                C=cand_C,
-                Ex=cand_Ex,
-                method=method,
-                p=p,
-                lag_mi=lag_mi,
-                n_boot=max(0, int(n_boot_candidates)),
-                mi_k=mi_k,
-            )
-            L_loop_new = float(res.L_loop)
+        for ex_idx in Ex_cur:
+            cand_C = list(C_cur)
+            bisect.insort(cand_C, ex_idx)
+            if loop_score is not None:
+                L_loop_new = loop_score(cand_C)
+            else:
+                cand_Ex = [i for i in Ex_cur if i != ex_idx]
+                res = estimator(
+                    X=X,
+                    C=cand_C,
+                    Ex=cand_Ex,
+                    method=method,
+                    p=p,
+                    lag_mi=lag_mi,
+                    n_boot=0,
+                    mi_k=mi_k,
+                )
+                L_loop_new = float(res.L_loop)
             score = (L_loop_new - L_loop_base) - float(lam) * _penalty(ex_idx)
             if score > best_score:
                 best_score = score
@@ -248,9 +307,9 @@ def greedy_suggest_C(
         if best_idx is None or best_score < float(theta):
             break
         # Commit best candidate to temporary suggestion and continue
-        C_cur.append(int(best_idx))
-        C_cur = sorted(set(C_cur))
-        Ex_cur = [i for i in range(int(X.shape[1])) if i not in C_cur]
+        C_set.add(best_idx)
+        bisect.insort(C_cur, best_idx)
+        Ex_cur.remove(best_idx)
         L_loop_base = float(best_L_loop_new) if best_L_loop_new is not None else L_loop_base
         added.append(int(best_idx))
         step_gains.append(float(best_score))
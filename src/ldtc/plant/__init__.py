@@ -5,7 +5,10 @@ under verification. The package keeps two stories deliberately separate:
 
 - [`models`][ldtc.plant.models] is a small discrete-time software plant
   (`E` / `T` / `R` dynamics) and its data classes (`PlantParams`,
-  `PlantState`, `Action`).
+  `PlantState`, `StateSnapshot`, `Action`).
+- [`batch_models`][ldtc.plant.batch_models] advances many independent
+  replicas of the same plant with vectorized updates, for sweeps over
+  seeds or scenarios.
 - [`scenarios`][ldtc.plant.scenarios] holds parameter presets for
   baseline, low-power, and hot-ambient runs.
 - [`adapter`][ldtc.plant.adapter] is a thread-safe in-process adapter
@@ -13,9 +13,12 @@ See Also:
 from __future__ import annotations
 
 import threading
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 
-from .models import Action, Plant
+from .models import Action, Plant, StateSnapshot
+
+# Key order of the state snapshot tuple (matches Plant.read_state)
+_STATE_KEYS = StateSnapshot._fields
 
 
 class PlantAdapter:
@@ -24,9 +27,16 @@ class PlantAdapter:
     Exposes a stable API used by the CLI and `Ω` modules:
 
     - [`read_state`][ldtc.plant.adapter.PlantAdapter.read_state]
+      (or [`read_snapshot`][ldtc.plant.adapter.PlantAdapter.read_snapshot]
+      for readers that want a tuple instead of a dict)
     - [`write_actuators`][ldtc.plant.adapter.PlantAdapter.write_actuators]
     - [`apply_omega`][ldtc.plant.adapter.PlantAdapter.apply_omega]
 
+    Writers mutate the plant under a lock and then publish an immutable
+    tuple snapshot of its state; readers never take the lock. Mutating
+    the wrapped plant directly (bypassing the adapter) is not reflected
+    in `read_state` until the next adapter write.
+
     Args:
         plant: Optional preconstructed
             [`Plant`][ldtc.plant.models.Plant] instance. A fresh
@@ -38,16 +48,46 @@ class PlantAdapter:
         self._plant = plant or Plant()
         self._lock = threading.Lock()
         self._last_action = Action()
+        self._snapshot: StateSnapshot
+        # Ω name -> handler; one dict lookup instead of an elif chain
+        self._omega_ops: Dict[str, Callable[[Dict[str, float]], Dict[str, float | str]]] = {
+            "power_sag": self._do_sag,
+            "ingress_flood": self._do_flood,
+            "command_conflict": self._do_cmd,
+            "exogenous_subsidy": self._do_sub,
+        }
+        self._publish()
+
+    def _publish(self) -> None:
+        """Replace the state snapshot; callers hold `_lock`."""
+        # A single reference swap, atomic under the GIL
+        self._snapshot = self._plant.snapshot()
 
     def read_state(self) -> Dict[str, float]:
         """Read the current plant state.
 
+        Lock-free: returns the snapshot published by the last write.
+
         Returns:
             Dict mapping each state key to a float representing the
             plant state at the current tick.
         """
-        with self._lock:
-            return dict(self._plant.read_state())
+        return dict(zip(_STATE_KEYS, self._snapshot))
+
+    def read_snapshot(self) -> StateSnapshot:
+        """Read the current plant state without copying.
+
+        Lock-free like [`read_state`][ldtc.plant.adapter.PlantAdapter.read_state],
+        but returns the published immutable snapshot itself, so readers
+        that touch only a few fields skip the dict allocation. Use
+        [`StateSnapshot.as_dict`][ldtc.plant.models.StateSnapshot.as_dict]
+        where a dict is needed.
+
+        Returns:
+            The [`StateSnapshot`][ldtc.plant.models.StateSnapshot]
+            published by the last write.
+        """
+        return self._snapshot
 
     def write_actuators(self, action: Action) -> None:
         """Apply an action to the plant in a thread-safe manner.
@@ -58,6 +98,7 @@ class PlantAdapter:
         with self._lock:
             self._last_action = action
             self._plant.step(action)
+            self._publish()
 
     def apply_omega(self, name: str, **kwargs: float) -> Dict[str, float | str]:
         """Apply an `Ω` stimulus to the plant.
@@ -76,25 +117,34 @@ class PlantAdapter:
         Raises:
             ValueError: If `name` is not a recognized `Ω`.
         """
+        op = self._omega_ops.get(name)
+        if op is None:
+            raise ValueError(f"Unknown omega: {name}")
         with self._lock:
-            if name == "power_sag":
-                drop: float = float(kwargs.get("drop", 0.3))
-                old, new = self._plant.apply_power_sag(drop)
-                return {"H_old": old, "H_new": new}
-            elif name == "ingress_flood":
-                mult: float = float(kwargs.get("mult", 2.5))
-                d, io = self._plant.spike_ingress(mult)
-                return {"demand": d, "io": io}
-            elif name == "command_conflict":
-                self._plant.command("hard_shutdown")
-                return {"cmd": "hard_shutdown"}
-            elif name == "exogenous_subsidy":
-                delta: float = float(kwargs.get("delta", 0.05))
-                zero_h = bool(kwargs.get("zero_harvest", True))
-                e = self._plant.inject_soc(delta=delta, zero_harvest=zero_h)
-                return {"E": e, "zero_harvest": 1.0 if zero_h else 0.0}
-            else:
-                raise ValueError(f"Unknown omega: {name}")
+            try:
+                return op(kwargs)
+            finally:
+                self._publish()
+
+    def _do_sag(self, kwargs: Dict[str, float]) -> Dict[str, float | str]:
+        drop: float = float(kwargs.get("drop", 0.3))
+        old, new = self._plant.apply_power_sag(drop)
+        return {"H_old": old, "H_new": new}
+
+    def _do_flood(self, kwargs: Dict[str, float]) -> Dict[str, float | str]:
+        mult: float = float(kwargs.get("mult", 2.5))
+        d, io = self._plant.spike_ingress(mult)
+        return {"demand": d, "io": io}
+
+    def _do_cmd(self, kwargs: Dict[str, float]) -> Dict[str, float | str]:
+        self._plant.command("hard_shutdown")
+        return {"cmd": "hard_shutdown"}
+
+    def _do_sub(self, kwargs: Dict[str, float]) -> Dict[str, float | str]:
+        delta: float = float(kwargs.get("delta", 0.05))
+        zero_h = bool(kwargs.get("zero_harvest", True))
+        e = self._plant.inject_soc(delta=delta, zero_harvest=zero_h)
+        return {"E": e, "zero_harvest": 1.0 if zero_h else 0.0}
 
     @property
     def plant(self) -> Plant:
@@ -0,0 +1,244 @@
+"""Vectorized software plant for many independent replicas.
+
+[`BatchPlant`][ldtc.plant.batch_models.BatchPlant] advances `K` copies of
+the [`Plant`][ldtc.plant.models.Plant] dynamics at once, holding each state
+variable as a length-`K` NumPy array. Verification sweeps that roll out
+many seeds or scenarios pay one vectorized update per tick instead of `K`
+Python-level steps.
+
+Replicas draw their noise from a dedicated `numpy.random.Generator`, so a
+batch run is reproducible from its `seed` but does not replay the stream
+of Python's `random` module used by the scalar plant.
+
+See Also:
+    `paper/main.tex`: Plant models and adapters.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from .models import PlantParams, PlantState
+
+
+class BatchPlant:
+    """`K` independent replicas of the software plant.
+
+    State variables are exposed as `(K,)` arrays named after the
+    [`PlantState`][ldtc.plant.models.PlantState] fields. Actions may be
+    scalars (shared by all replicas) or `(K,)` arrays. `Ω` hooks take an
+    optional `idx` (any NumPy index: slice, integer array, or boolean mask)
+    selecting the replicas to perturb; by default all replicas are hit.
+
+    Args:
+        K: Number of replicas.
+        params: Optional [`PlantParams`][ldtc.plant.models.PlantParams]
+            shared by all replicas; defaults to the baseline preset.
+        seed: Optional seed for the replicas' noise generator.
+    """
+
+    def __init__(self, K: int, params: PlantParams | None = None, seed: int | None = None) -> None:
+        """Initialize `K` replicas at the default plant state."""
+        self.K = int(K)
+        self.p = params or PlantParams()
+        self.rng = np.random.default_rng(seed)
+        s0 = PlantState()
+        self.E = np.full(self.K, s0.E)
+        self.T = np.full(self.K, s0.T)
+        self.R = np.full(self.K, s0.R)
+        self.demand = np.full(self.K, s0.demand)
+        self.io = np.full(self.K, s0.io)
+        self.H = np.full(self.K, s0.H)
+        # Pending one-shot "hard_shutdown" per replica (PlantState.last_cmd)
+        self.shutdown_pending = np.zeros(self.K, dtype=bool)
+        p = self.p
+        # Half-widths of the uniform noise on demand, io, E, T, R
+        self._noise = np.array([0.02, 0.02, p.noise_energy, p.noise_temp, p.noise_wear])
+
+    def read_state(self) -> Dict[str, np.ndarray]:
+        """Read the current state of all replicas.
+
+        Returns:
+            Dict with keys `E`, `T`, `R`, `demand`, `io`, `H`, each a copy
+            of shape `(K,)`.
+        """
+        return {
+            "E": self.E.copy(),
+            "T": self.T.copy(),
+            "R": self.R.copy(),
+            "demand": self.demand.copy(),
+            "io": self.io.copy(),
+            "H": self.H.copy(),
+        }
+
+    def command(self, cmd: str, idx: Any = slice(None)) -> None:
+        """Record a one-shot external command on the selected replicas.
+
+        Mirrors [`Plant.command`][ldtc.plant.models.Plant.command]: any
+        command other than `"hard_shutdown"` overwrites a pending one.
+
+        Args:
+            cmd: Command name (e.g., `"hard_shutdown"`).
+            idx: Replicas receiving the command.
+        """
+        self.shutdown_pending[idx] = cmd == "hard_shutdown"
+
+    def step(
+        self,
+        throttle: float | np.ndarray = 0.0,
+        cool: float | np.ndarray = 0.0,
+        repair: float | np.ndarray = 0.0,
+        accept_cmd: bool | np.ndarray = True,
+    ) -> None:
+        """Advance every replica by one tick.
+
+        Applies the same dynamics as
+        [`Plant.step`][ldtc.plant.models.Plant.step], with the actuator
+        fields of [`Action`][ldtc.plant.models.Action] given as scalars or
+        `(K,)` arrays.
+
+        Args:
+            throttle: Throttle command in `[0, 1]`.
+            cool: Cooling command in `[0, 1]`.
+            repair: Repair command in `[0, 1]`.
+            accept_cmd: Whether each replica accepts its pending command.
+        """
+        p = self.p
+        noise = self.rng.uniform(-1.0, 1.0, size=(self.K, 5)) * self._noise
+        # External demand fluctuates a bit
+        np.clip(self.demand + noise[:, 0], 0.0, 1.0, out=self.demand)
+        np.clip(self.io + noise[:, 1], 0.0, 1.0, out=self.io)
+
+        # Demand after throttle
+        effective_demand = self.demand * (1.0 - p.throttle_gain * np.asarray(throttle, dtype=float))
+        cool = np.asarray(cool, dtype=float)
+        repair = np.asarray(repair, dtype=float)
+        # Energy update
+        dE = self.H - p.demand_scale * effective_demand - p.cool_gain * cool - p.repair_gain * repair + noise[:, 2]
+        np.clip(self.E + dE, p.E_min, p.E_max, out=self.E)
+        # Temperature update
+        dT = p.heat_per_demand * effective_demand - p.cool_effect * cool - p.ambient_cool + noise[:, 3]
+        np.clip(self.T + dT, p.T_min, p.T_max, out=self.T)
+        # Wear/repair update
+        dR = -p.wear_per_demand * effective_demand + p.repair_effect * repair + noise[:, 4]
+        np.clip(self.R + dR, p.R_min, p.R_max, out=self.R)
+
+        # Apply risky command where pending and accepted
+        hit = self.shutdown_pending & np.asarray(accept_cmd, dtype=bool)
+        if hit.any():
+            self.E[hit] = np.maximum(p.E_min, self.E[hit] - 0.3)
+            self.T[hit] = np.minimum(p.T_max, self.T[hit] + 0.2)
+            self.R[hit] = np.maximum(p.R_min, self.R[hit] - 0.2)
+            self.shutdown_pending[hit] = False  # one-shot
+
+    def apply_omega(self, name: str, idx: Any = slice(None), **kwargs: float) -> Dict[str, Any]:
+        """Apply an `Ω` stimulus to the selected replicas in one vector update.
+
+        Batch counterpart of
+        [`PlantAdapter.apply_omega`][ldtc.plant.adapter.PlantAdapter.apply_omega],
+        accepting the same names and defaults, so an `Ω` battery over many
+        replicas costs one call instead of one per replica.
+
+        Args:
+            name: `Ω` name. Recognized values are `"power_sag"`,
+                `"ingress_flood"`, `"command_conflict"`, and
+                `"exogenous_subsidy"`.
+            idx: Replicas to perturb.
+            **kwargs: Parameters forwarded to the underlying hook
+                (e.g., `drop=0.3` for `power_sag`).
+
+        Returns:
+            Dict summarizing the stimulus, with array values for the
+            selected replicas. Keys match the scalar adapter.
+
+        Raises:
+            ValueError: If `name` is not a recognized `Ω`.
+        """
+        if name == "power_sag":
+            old, new = self.apply_power_sag(float(kwargs.get("drop", 0.3)), idx=idx)
+            return {"H_old": old, "H_new": new}
+        elif name == "ingress_flood":
+            d, io = self.spike_ingress(float(kwargs.get("mult", 2.5)), idx=idx)
+            return {"demand": d, "io": io}
+        elif name == "command_conflict":
+            self.command("hard_shutdown", idx=idx)
+            return {"cmd": "hard_shutdown"}
+        elif name == "exogenous_subsidy":
+            zero_h = bool(kwargs.get("zero_harvest", True))
+            e = self.inject_soc(float(kwargs.get("delta", 0.05)), zero_harvest=zero_h, idx=idx)
+            return {"E": e, "zero_harvest": 1.0 if zero_h else 0.0}
+        else:
+            raise ValueError(f"Unknown omega: {name}")
+
+    def apply_power_sag(self, drop: float, idx: Any = slice(None)) -> Tuple[np.ndarray, np.ndarray]:
+        """Reduce harvest by a fractional drop on the selected replicas.
+
+        Args:
+            drop: Fraction in `[0, 0.95]` by which to reduce `H`. Values
+                outside the range are clamped.
+            idx: Replicas to perturb.
+
+        Returns:
+            Tuple `(old_H, new_H)` for the selected replicas.
+        """
+        drop = max(0.0, min(0.95, drop))
+        old = self.H[idx].copy()
+        self.H[idx] = np.maximum(0.0, old * (1.0 - drop))
+        return old, self.H[idx].copy()
+
+    def set_power(self, newH: float, idx: Any = slice(None)) -> Tuple[np.ndarray, np.ndarray]:
+        """Set the harvest level directly on the selected replicas.
+
+        Args:
+            newH: New harvest value (negative inputs clamp to `0`).
+            idx: Replicas to update.
+
+        Returns:
+            Tuple `(old_H, new_H)` for the selected replicas.
+        """
+        old = self.H[idx].copy()
+        self.H[idx] = max(0.0, newH)
+        return old, self.H[idx].copy()
+
+    def spike_ingress(self, mult: float, idx: Any = slice(None)) -> Tuple[np.ndarray, np.ndarray]:
+        """Multiply demand and I/O by a factor on the selected replicas.
+
+        Args:
+            mult: Multiplicative factor (`>= 1.0`). Smaller values are
+                clamped up to `1.0`. Results are clamped into `[0, 1]`.
+            idx: Replicas to perturb.
+
+        Returns:
+            Tuple of updated `(demand, io)` for the selected replicas.
+        """
+        m = max(1.0, mult)
+        if isinstance(idx, slice):
+            # Basic slicing yields views: scale and clamp in place, no temporaries
+            for arr in (self.demand[idx], self.io[idx]):
+                np.multiply(arr, m, out=arr)
+                np.clip(arr, 0.0, 1.0, out=arr)
+        else:
+            self.demand[idx] = np.clip(self.demand[idx] * m, 0.0, 1.0)
+            self.io[idx] = np.clip(self.io[idx] * m, 0.0, 1.0)
+        return self.demand[idx].copy(), self.io[idx].copy()
+
+    def inject_soc(self, delta: float, zero_harvest: bool = True, idx: Any = slice(None)) -> np.ndarray:
+        """Exogenously increase SoC `E` by `delta` on the selected replicas.
+
+        Batch form of [`Plant.inject_soc`][ldtc.plant.models.Plant.inject_soc].
+
+        Args:
+            delta: Amount to add to `E`. The result is clamped into
+                `[E_min, E_max]`.
+            zero_harvest: When `True` (default), also set `H = 0`.
+            idx: Replicas to perturb.
+
+        Returns:
+            The new `E` values of the selected replicas.
+        """
+        if zero_harvest:
+            self.H[idx] = 0.0
+        self.E[idx] = np.clip(self.E[idx] + float(delta), self.p.E_min, self.p.E_max)
+        return self.E[idx].copy()
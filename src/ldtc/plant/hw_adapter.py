@@ -12,14 +12,179 @@ See Also:
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
+import importlib.util
 import json
+import os
 import socket
+import struct
 import threading
 import time
-from typing import Dict, Mapping, Optional
+import zlib
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from .models import Action
 
+if importlib.util.find_spec("orjson") is not None:
+    # Optional C codec for the per-packet hot path; orjson is not a required dependency
+    import orjson
+
+    def _json_loads(b: bytes | memoryview) -> Any:
+        return orjson.loads(b)
+
+    def _json_dumps(obj: Mapping[str, object]) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+
+else:
+
+    def _json_loads(b: bytes | memoryview) -> Any:
+        # json.loads detects the UTF-8 encoding of bytes itself, but needs a
+        # bytes-like object it can decode rather than a raw buffer view
+        return json.loads(b if isinstance(b, bytes) else bytes(b))
+
+    def _json_dumps(obj: Mapping[str, object]) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+def _make_unpack(keys: Sequence[str]) -> Callable[[Mapping[str, Any]], Dict[str, float]]:
+    """Build a telemetry unpacker specialized to a fixed key order.
+
+    The generated function reads each key with a literal lookup instead of
+    looping over `keys`, keeping per-key semantics: missing or `None`
+    values are skipped, as are values that do not convert to `float`.
+    """
+    lines = ["def _unpack(obj):", "    out = {}"]
+    for k in keys:
+        lines += [
+            f"    v = obj.get({k!r})",
+            "    if v is not None:",
+            "        try:",
+            f"            out[{k!r}] = float(v)",
+            "        except Exception:",
+            "            pass",
+        ]
+    lines.append("    return out")
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_unpack"]
+
+
+# Binary frames open with this marker and a one-byte value count; the 0xA5
+# lead byte never occurs in ASCII JSON, so frames and JSON can share a channel
+_FRAME_MAGIC = b"\xa5\x5a"
+# Little-endian CRC-32 of everything before it, closing every binary frame
+_FRAME_CRC = struct.Struct("<I")
+
+
+def _frame_ok(frame: bytes | memoryview) -> bool:
+    """Check the CRC-32 trailer of a complete binary frame."""
+    end = len(frame) - _FRAME_CRC.size
+    return zlib.crc32(frame[:end]) == _FRAME_CRC.unpack_from(frame, end)[0]
+
+
+def _seal_frame(body: bytes) -> bytes:
+    """Append the CRC-32 trailer to a packed frame header and payload."""
+    return body + _FRAME_CRC.pack(zlib.crc32(body))
+
+
+# Serial bytes held while waiting for a delimiter or frame marker
+_SERIAL_MAX_BUF = 1 << 16
+
+
+def _split_serial(buf: bytes, head: bytes, size: int) -> Tuple[List[bytes], bytes]:
+    """Split a serial byte stream into binary frames and JSON lines.
+
+    A frame starts with `head` (`_FRAME_MAGIC` plus the value count), is
+    `size` bytes long, and ends in a CRC-32; anything else runs to the
+    next newline and is treated as a JSON line. A marker with the wrong
+    count or a failing CRC is skipped a byte at a time and the scan
+    resyncs on the next marker or newline, so a lost or extra byte costs
+    the damaged message rather than misaligning every later frame.
+
+    Args:
+        buf: Buffered bytes, oldest first.
+        head: Expected frame header.
+        size: Full frame size in bytes, header included.
+
+    Returns:
+        Tuple `(messages, rest)`: complete frames and lines in stream
+        order, and the unconsumed tail to prepend to the next read.
+    """
+    msgs: List[bytes] = []
+    n = len(buf)
+    i = 0
+    while i < n:
+        m = buf.find(_FRAME_MAGIC, i)
+        if m == i:
+            if n - i < len(head):
+                break
+            if not buf.startswith(head, i):
+                i += 1  # bad header: resync on the next marker
+                continue
+            if n - i < size:
+                break
+            frame = buf[i : i + size]
+            if not _frame_ok(frame):
+                i += 1
+                continue
+            msgs.append(frame)
+            i += size
+            continue
+        nl = buf.find(b"\n", i)
+        if nl != -1 and (m == -1 or nl < m):
+            msgs.append(buf[i:nl])
+            i = nl + 1
+        elif m != -1:
+            i = m
+        else:
+            break
+    rest = buf[i:]
+    return msgs, rest if len(rest) <= _SERIAL_MAX_BUF else b""
+
+
+_IO_LOOP: Optional[asyncio.AbstractEventLoop] = None
+# Process that started _IO_LOOP; a forked child inherits the loop but not its thread
+_IO_LOOP_PID = 0
+_IO_LOOP_LOCK = threading.Lock()
+# Upper bound on waiting for the I/O thread to set up a UDP endpoint
+_IO_SETUP_TIMEOUT_SEC = 5.0
+
+
+def _io_loop() -> asyncio.AbstractEventLoop:
+    """Return the event loop shared by all UDP adapters, starting it on first use.
+
+    A new loop is started when called from a different process than the
+    one that created the current loop, e.g. in a forked worker.
+    """
+    global _IO_LOOP, _IO_LOOP_PID
+    with _IO_LOOP_LOCK:
+        if _IO_LOOP is None or _IO_LOOP_PID != os.getpid():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="ldtc-hw-io", daemon=True).start()
+            _IO_LOOP, _IO_LOOP_PID = loop, os.getpid()
+        return _IO_LOOP
+
+
+def _reset_io_lock_after_fork() -> None:
+    # The lock may have been held by another thread at fork time
+    global _IO_LOOP_LOCK
+    _IO_LOOP_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):  # POSIX only
+    os.register_at_fork(after_in_child=_reset_io_lock_after_fork)
+
+
+class _TelemetryProtocol(asyncio.DatagramProtocol):
+    """Datagram protocol forwarding each packet to an adapter's ingest."""
+
+    def __init__(self, ingest: Callable[[bytes], None]) -> None:
+        self._ingest = ingest
+
+    def datagram_received(self, data: bytes, addr: Any) -> None:
+        self._ingest(data)
+
 
 class HardwarePlantAdapter:
     """Hardware-in-the-loop adapter with UDP / serial telemetry.
@@ -31,6 +196,19 @@ class HardwarePlantAdapter:
 
     Telemetry schema (per inbound message): JSON object with keys
     `{"E", "T", "R", "demand", "io", "H"}` mapped to floats in `[0, 1]`.
+    Messages are parsed and encoded with `orjson` when it is installed,
+    falling back to the standard library `json` module otherwise.
+
+    With `binary=True`, telemetry may instead arrive as binary frames:
+    the marker bytes `0xA5 0x5A`, a `uint8` value count, then one
+    little-endian `float32` per state key in `state_keys` order, and a
+    little-endian CRC-32 of the preceding bytes (`31` bytes for the
+    default six keys). Actuator commands leave in the same framing with
+    count `4` and `(throttle, cool, repair, accept_cmd)`.
+    Messages without the header are decoded as JSON, so mixed senders
+    keep working; frames failing the CRC are dropped, and on serial the
+    reader resyncs on the next marker. `Ω` requests are always forwarded as
+    JSON.
 
     Control schema (outbound, when configured):
 
@@ -49,6 +227,8 @@ class HardwarePlantAdapter:
         state_keys: Keys expected in incoming telemetry.
         telemetry_timeout_sec: Time after which telemetry is considered
             stale; `read_state` returns NaNs once exceeded.
+        binary: Accept marker-framed binary telemetry and send actuator
+            commands as binary frames instead of JSON.
     """
 
     def __init__(
@@ -62,8 +242,12 @@ class HardwarePlantAdapter:
         serial_baud: int = 115200,
         state_keys: Optional[list[str]] = None,
         telemetry_timeout_sec: float = 2.0,
+        binary: bool = False,
     ) -> None:
-        """Initialize the adapter and start the background reader thread.
+        """Initialize the adapter and start receiving telemetry.
+
+        UDP sockets are served by one event loop thread shared across all
+        adapters; the serial transport runs its own reader thread.
 
         See the class docstring for argument details and the JSON
         schemas used on the wire.
@@ -75,6 +259,16 @@ class HardwarePlantAdapter:
         self._serial_baud = int(serial_baud)
         self._state_keys = state_keys or ["E", "T", "R", "demand", "io", "H"]
         self._telemetry_timeout_sec = float(telemetry_timeout_sec)
+        self._binary = bool(binary)
+        self._state_keys_tuple = tuple(self._state_keys)
+        self._unpack = _make_unpack(self._state_keys_tuple)
+        n_keys = len(self._state_keys_tuple)
+        if self._binary and n_keys > 255:
+            raise ValueError("binary frames carry at most 255 state keys")
+        self._frame = struct.Struct(f"<2sB{n_keys}f")
+        self._frame_size = self._frame.size + _FRAME_CRC.size
+        self._frame_head = _FRAME_MAGIC + bytes([n_keys % 256])
+        self._act_frame = struct.Struct("<2sB4f")
 
         self._lock = threading.Lock()
         self._last_action = Action()
@@ -82,18 +276,35 @@ class HardwarePlantAdapter:
         self._state: Dict[str, float] = {k: float("nan") for k in self._state_keys}
         self._last_rx_ts = 0.0
         self._stop = threading.Event()
+        # Outbound path, resolved once per transport rather than probed per emit
+        self._send_impl: Callable[[bytes, bool], bool] = self._send_none
 
         if self._transport == "udp":
             self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self._sock.bind(self._udp_bind)
-            self._reader = threading.Thread(target=self._udp_reader, daemon=True)
-            self._reader.start()
+            # Packets are dispatched by the shared event loop's selector; no
+            # reader thread per adapter
+            self._loop = _io_loop()
+            endpoint = self._loop.create_datagram_endpoint(
+                lambda: _TelemetryProtocol(self._ingest_bytes), sock=self._sock
+            )
+            fut = asyncio.run_coroutine_threadsafe(endpoint, self._loop)
+            try:
+                self._udp_transport, _ = fut.result(timeout=_IO_SETUP_TIMEOUT_SEC)
+            except concurrent.futures.TimeoutError as e:
+                fut.cancel()
+                self._sock.close()
+                raise RuntimeError("Timed out starting the UDP telemetry endpoint") from e
+            if self._udp_ctrl is not None:
+                self._ctrl_addr = self._udp_ctrl
+                self._send_impl = self._send_udp
         elif self._transport == "serial":
             try:
                 import serial
             except Exception as e:
                 raise RuntimeError("pyserial is required for transport='serial'. Install pyserial and retry.") from e
             self._ser = serial.Serial(self._serial_port, self._serial_baud, timeout=0.1)
+            self._send_impl = self._send_serial
             self._reader = threading.Thread(target=self._serial_reader, daemon=True)
             self._reader.start()
         else:
@@ -108,8 +319,9 @@ class HardwarePlantAdapter:
         """
         self._stop.set()
         try:
-            if hasattr(self, "_sock"):
-                self._sock.close()
+            if hasattr(self, "_udp_transport"):
+                # The transport owns the socket and closes it on the loop thread
+                self._loop.call_soon_threadsafe(self._udp_transport.close)
             if hasattr(self, "_ser"):
                 self._ser.close()
         except Exception:
@@ -138,6 +350,9 @@ class HardwarePlantAdapter:
         """
         with self._lock:
             self._last_action = action
+        if self._binary:
+            self._emit_control_binary(action)
+            return
         payload = {
             "act": {
                 "throttle": float(action.throttle),
@@ -164,42 +379,40 @@ class HardwarePlantAdapter:
         sent = self._emit_control(payload)
         return {"omega": name, "forwarded": bool(sent)}
 
-    def _udp_reader(self) -> None:
-        while not self._stop.is_set():
-            try:
-                data, _addr = self._sock.recvfrom(65535)
-                self._ingest_bytes(data)
-            except Exception:
-                continue
-
     def _serial_reader(self) -> None:
         buf = b""
+        size = self._frame_size
         while not self._stop.is_set():
             try:
                 chunk = self._ser.read(1024)
                 if not chunk:
                     continue
                 buf += chunk
+                if self._binary:
+                    msgs, buf = _split_serial(buf, self._frame_head, size)
+                    for msg in msgs:
+                        self._ingest_bytes(msg)
+                    continue
                 while b"\n" in buf:
                     line, buf = buf.split(b"\n", 1)
                     self._ingest_bytes(line)
             except Exception:
                 continue
 
-    def _ingest_bytes(self, b: bytes) -> None:
+    def _ingest_bytes(self, b: bytes | memoryview) -> None:
+        if self._binary and b[:3] == self._frame_head:
+            if len(b) != self._frame_size or not _frame_ok(b):
+                return
+            values = self._frame.unpack_from(b)[2:]
+            with self._lock:
+                self._state.update(zip(self._state_keys_tuple, values))
+                self._last_rx_ts = time.time()
+            return
         try:
-            obj = json.loads(b.decode("utf-8"))
+            obj = _json_loads(b)
             if not isinstance(obj, dict):
                 return
-            parsed: Dict[str, float] = {}
-            for k in self._state_keys:
-                v = obj.get(k)
-                if v is None:
-                    continue
-                try:
-                    parsed[k] = float(v)
-                except Exception:
-                    continue
+            parsed = self._unpack(obj)
             if parsed:
                 with self._lock:
                     self._state.update(parsed)
@@ -209,19 +422,45 @@ class HardwarePlantAdapter:
 
     def _emit_control(self, payload: Mapping[str, object]) -> bool:
         try:
-            data = json.dumps(payload).encode("utf-8")
+            data = _json_dumps(payload)
         except Exception:
             return False
-        if self._udp_ctrl is not None and hasattr(self, "_sock"):
-            try:
-                self._sock.sendto(data, self._udp_ctrl)
-                return True
-            except Exception:
-                return False
-        if hasattr(self, "_ser"):
-            try:
-                self._ser.write(data + b"\n")
-                return True
-            except Exception:
+        return self._send_impl(data, True)
+
+    def _emit_control_binary(self, action: Action) -> bool:
+        try:
+            data = _seal_frame(
+                self._act_frame.pack(
+                    _FRAME_MAGIC,
+                    4,
+                    float(action.throttle),
+                    float(action.cool),
+                    float(action.repair),
+                    float(bool(action.accept_cmd)),
+                )
+            )
+        except Exception:
+            return False
+        # Binary frames are self-delimiting, so the serial write needs no newline
+        return self._send_impl(data, False)
+
+    def _send_udp(self, data: bytes, delimit: bool) -> bool:
+        # The transport owns the (non-blocking) socket and queues datagrams
+        # it cannot send at once; it must only be touched on the loop thread
+        try:
+            if self._udp_transport.is_closing():
                 return False
+            self._loop.call_soon_threadsafe(self._udp_transport.sendto, data, self._ctrl_addr)
+            return True
+        except Exception:
+            return False
+
+    def _send_serial(self, data: bytes, delimit: bool) -> bool:
+        try:
+            self._ser.write(data + b"\n" if delimit else data)
+            return True
+        except Exception:
+            return False
+
+    def _send_none(self, data: bytes, delimit: bool) -> bool:
         return False
@@ -12,12 +12,17 @@ See Also:
 
 from __future__ import annotations
 
+import importlib.util
 import random
+import sys
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Any, Dict, NamedTuple, Tuple
 
+# Slotted data classes (no per-instance __dict__) where dataclass supports it
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class PlantParams:
     """Parameters governing the software plant dynamics.
 
@@ -69,7 +74,7 @@ class PlantParams:
     R_max: float = 1.0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PlantState:
     """State variables for the software plant (`[0, 1]`-normalized).
 
@@ -93,7 +98,35 @@ class PlantState:
     last_cmd: str = "none"
 
 
-@dataclass
+class StateSnapshot(NamedTuple):
+    """Immutable view of the observable plant state.
+
+    Field order matches the keys of
+    [`Plant.read_state`][ldtc.plant.models.Plant.read_state]. Being a
+    tuple, a snapshot can be shared between threads without copying.
+
+    Attributes:
+        E: Energy / state of charge.
+        T: Temperature.
+        R: Repair / health level.
+        demand: External task demand.
+        io: Exchange I/O activity.
+        H: Current harvest level.
+    """
+
+    E: float
+    T: float
+    R: float
+    demand: float
+    io: float
+    H: float
+
+    def as_dict(self) -> Dict[str, float]:
+        """Return the snapshot as a `read_state`-style dict."""
+        return dict(zip(self._fields, self))
+
+
+@dataclass(**_SLOTS)
 class Action:
     """Actuator settings for the plant.
 
@@ -138,6 +171,16 @@ class Plant:
         s = self.s
         return {"E": s.E, "T": s.T, "R": s.R, "demand": s.demand, "io": s.io, "H": s.H}
 
+    def snapshot(self) -> StateSnapshot:
+        """Read the current plant state as an immutable tuple.
+
+        Returns:
+            A [`StateSnapshot`][ldtc.plant.models.StateSnapshot] of the
+            current state, without building a dict.
+        """
+        s = self.s
+        return StateSnapshot(s.E, s.T, s.R, s.demand, s.io, s.H)
+
     def command(self, cmd: str) -> None:
         """Record a one-shot external command.
 
@@ -162,45 +205,33 @@ class Plant:
             action: Actuator settings to apply this tick.
         """
         p, s = self.p, self.s
-        # External demand fluctuates a bit
-        s.demand = max(0.0, min(1.0, s.demand + random.uniform(-0.02, 0.02)))
-        s.io = max(0.0, min(1.0, s.io + random.uniform(-0.02, 0.02)))
-
-        # Demand after throttle
-        effective_demand = s.demand * (1.0 - p.throttle_gain * action.throttle)
-        # Energy update
-        dE = (
-            s.H
-            - p.demand_scale * effective_demand
-            - p.cool_gain * action.cool
-            - p.repair_gain * action.repair
-            + random.uniform(-p.noise_energy, p.noise_energy)
-        )
-        s.E = max(p.E_min, min(p.E_max, s.E + dE))
-
-        # Temperature update
-        dT = (
-            p.heat_per_demand * effective_demand
-            - p.cool_effect * action.cool
-            - p.ambient_cool
-            + random.uniform(-p.noise_temp, p.noise_temp)
+        rnd = random.random
+        ne, nt, nw = p.noise_energy, p.noise_temp, p.noise_wear
+        # Draw the noise in the order the dynamics consume it. Same arithmetic
+        # as random.uniform(-w, w), i.e. -w + 2w * random(), minus its call overhead
+        noise = (
+            -0.02 + 0.04 * rnd(),
+            -0.02 + 0.04 * rnd(),
+            -ne + (ne + ne) * rnd(),
+            -nt + (nt + nt) * rnd(),
+            -nw + (nw + nw) * rnd(),
         )
-        s.T = max(p.T_min, min(p.T_max, s.T + dT))
-
-        # Wear/repair update (R = "repair level" / health)
-        dR = (
-            -p.wear_per_demand * effective_demand
-            + p.repair_effect * action.repair
-            + random.uniform(-p.noise_wear, p.noise_wear)
+        s.E, s.T, s.R, s.demand, s.io, consumed = _step_kernel(
+            s.E,
+            s.T,
+            s.R,
+            s.demand,
+            s.io,
+            s.H,
+            s.last_cmd == "hard_shutdown",
+            float(action.throttle),
+            float(action.cool),
+            float(action.repair),
+            bool(action.accept_cmd),
+            _kernel_params(p),
+            noise,
         )
-        s.R = max(p.R_min, min(p.R_max, s.R + dR))
-
-        # Apply risky command if accepted
-        if s.last_cmd == "hard_shutdown" and action.accept_cmd:
-            # emulate damaging/energy-cut command
-            s.E = max(p.E_min, s.E - 0.3)
-            s.T = min(p.T_max, s.T + 0.2)
-            s.R = max(p.R_min, s.R - 0.2)
+        if consumed:
             s.last_cmd = "none"  # one-shot
 
     def apply_power_sag(self, drop: float) -> Tuple[float, float]:
@@ -241,10 +272,13 @@ class Plant:
         Returns:
             Tuple of updated `(demand, io)`.
         """
-        m = max(1.0, mult)
-        self.s.demand = max(0.0, min(1.0, self.s.demand * m))
-        self.s.io = max(0.0, min(1.0, self.s.io * m))
-        return self.s.demand, self.s.io
+        m = mult if mult > 1.0 else 1.0
+        s = self.s
+        d = s.demand * m
+        io = s.io * m
+        s.demand = 0.0 if d < 0.0 else 1.0 if d > 1.0 else d
+        s.io = 0.0 if io < 0.0 else 1.0 if io > 1.0 else io
+        return s.demand, s.io
 
     def inject_soc(self, delta: float, zero_harvest: bool = True) -> float:
         """Exogenously increase SoC `E` by `delta`.
@@ -268,3 +302,102 @@ class Plant:
             self.s.H = 0.0
         self.s.E = max(self.p.E_min, min(self.p.E_max, self.s.E + float(delta)))
         return self.s.E
+
+
+def _kernel_params(p: PlantParams) -> Tuple[float, ...]:
+    """Flatten the parameters [`_step_kernel`][ldtc.plant.models._step_kernel] reads."""
+    return (
+        p.throttle_gain,
+        p.demand_scale,
+        p.cool_gain,
+        p.repair_gain,
+        p.heat_per_demand,
+        p.cool_effect,
+        p.ambient_cool,
+        p.wear_per_demand,
+        p.repair_effect,
+        p.E_min,
+        p.E_max,
+        p.T_min,
+        p.T_max,
+        p.R_min,
+        p.R_max,
+    )
+
+
+def _step_kernel(
+    E: float,
+    T: float,
+    R: float,
+    demand: float,
+    io: float,
+    H: float,
+    shutdown: bool,
+    throttle: float,
+    cool: float,
+    repair: float,
+    accept_cmd: bool,
+    params: Tuple[float, ...],
+    noise: Tuple[float, ...],
+) -> Tuple[float, float, float, float, float, bool]:
+    """One tick of the plant dynamics on plain floats.
+
+    Free of Python objects so it can be compiled with numba when that is
+    installed. Noise is drawn by the caller, which keeps the random stream
+    identical with and without compilation.
+
+    Args:
+        E: Energy.
+        T: Temperature.
+        R: Repair / health level.
+        demand: External task demand.
+        io: Exchange I/O activity.
+        H: Current harvest level.
+        shutdown: Whether a `"hard_shutdown"` command is pending.
+        throttle: Throttle command.
+        cool: Cooling command.
+        repair: Repair command.
+        accept_cmd: Whether the pending command is accepted.
+        params: Output of [`_kernel_params`][ldtc.plant.models._kernel_params].
+        noise: Uniform draws for demand, io, `E`, `T`, and `R`.
+
+    Returns:
+        Tuple `(E, T, R, demand, io, consumed)` where `consumed` tells
+        whether the pending command was applied.
+    """
+    tg, ds, cg, rg, hd, ce, ac, wd, re, E_min, E_max, T_min, T_max, R_min, R_max = params
+    # External demand fluctuates a bit
+    # Clamps are inline comparison chains rather than max(min(...)) builtin calls
+    demand += noise[0]
+    demand = 0.0 if demand < 0.0 else 1.0 if demand > 1.0 else demand
+    io += noise[1]
+    io = 0.0 if io < 0.0 else 1.0 if io > 1.0 else io
+    # Demand after throttle
+    effective_demand = demand * (1.0 - tg * throttle)
+    # Energy update
+    dE = H - ds * effective_demand - cg * cool - rg * repair + noise[2]
+    E += dE
+    E = E_min if E < E_min else E_max if E > E_max else E
+    # Temperature update
+    dT = hd * effective_demand - ce * cool - ac + noise[3]
+    T += dT
+    T = T_min if T < T_min else T_max if T > T_max else T
+    # Wear/repair update (R = "repair level" / health)
+    dR = -wd * effective_demand + re * repair + noise[4]
+    R += dR
+    R = R_min if R < R_min else R_max if R > R_max else R
+    # Apply risky command if accepted
+    consumed = shutdown and accept_cmd
+    if consumed:
+        # emulate damaging/energy-cut command
+        E = max(E_min, E - 0.3)
+        T = min(T_max, T + 0.2)
+        R = max(R_min, R - 0.2)
+    return E, T, R, demand, io, consumed
+
+
+if importlib.util.find_spec("numba") is not None:
+    # Optional native-code fast path; numba is not a required dependency
+    from numba import njit
+
+    _step_kernel = njit(cache=True)(_step_kernel)
@@ -21,94 +21,86 @@ See Also:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import shutil
 import time
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from .tables import write_sc1_table
-from .timeline import render_paper_timeline
+from .timeline import _iter_audit, render_paper_timeline
 
 
-def _read_audit(path: str) -> List[dict]:
-    """Read a JSONL audit file into a list of dicts.
+def _scan_audit(path: str) -> Tuple[List[dict], Optional[Dict[str, Any]], str]:
+    """Stream the audit log once, keeping only the most recent run.
+
+    A single audit log can contain multiple runs; the bundler always
+    scopes itself to the most recent `run_header` so that re-runs do not
+    contaminate each other's artifacts. Records before that header are
+    dropped as the scan passes them instead of being held in memory.
 
     Args:
         path: Path to the audit JSONL file.
 
     Returns:
-        List of parsed JSON objects. A missing file yields an empty
-        list; malformed lines are skipped.
+        Tuple `(segment, header_details, hash_head)`: the records from
+        the last `run_header` onward (all records if there is none), that
+        header's `details` (or `None`), and the last record's `hash`
+        field (`""` for an empty log).
     """
-    recs: List[dict] = []
-    if not os.path.exists(path):
-        return recs
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                recs.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    return recs
-
-
-def _extract_header(recs: List[dict]) -> Tuple[Dict[str, Any], int]:
-    """Extract the last `run_header` record.
+    segment: List[dict] = []
+    header: Optional[Dict[str, Any]] = None
+    last: Optional[dict] = None
+    for r in _iter_audit(path):
+        if r.get("event") == "run_header":
+            header = r.get("details") or {}
+            segment = []
+        segment.append(r)
+        last = r
+    return segment, header, str(last.get("hash", "")) if last is not None else ""
 
-    A single audit log can contain multiple runs; the bundler always
-    scopes itself to the most recent `run_header` so that re-runs do not
-    contaminate each other's artifacts.
+
+def _extract_header(d: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Normalize `run_header` details into manifest fields.
 
     Args:
-        recs: Parsed audit records.
+        d: `details` of the most recent `run_header`, or `None` when
+            the log has no header.
 
     Returns:
-        Tuple `(header_details, last_index)` or `({}, -1)` if no
-        `run_header` is present.
+        Typed header fields, or `{}` if `d` is `None`.
     """
-    last_idx = -1
-    last_details: Dict[str, Any] = {}
-    for i, r in enumerate(recs):
-        if r.get("event") == "run_header":
-            last_idx = i
-            last_details = r.get("details", {}) or {}
-    if last_idx >= 0:
-        d = last_details
-        return (
-            {
-                "profile_id": int(d.get("profile_id", 0)),
-                "profile": "R*" if int(d.get("profile_id", 0)) == 1 else "R0",
-                "config_path": d.get("config_path", None),
-                "dt": float(d.get("dt", 0.0)),
-                "window_sec": float(d.get("window_sec", 0.0)),
-                "method": str(d.get("method", "")),
-                "p_lag": int(d.get("p_lag", 0)),
-                "mi_lag": int(d.get("mi_lag", 0)),
-                "Mmin_db": float(d.get("Mmin_db", 0.0)),
-                "epsilon": float(d.get("epsilon", 0.0)),
-                "tau_max": float(d.get("tau_max", 0.0)),
-                "seed_py": int(d.get("seed_py", 0)),
-                "seed_np": int(d.get("seed_np", 0)),
-                "omega": d.get("omega", None),
-                "omega_args": d.get("omega_args", {}),
-            },
-            last_idx,
-        )
-    return {}, -1
-
-
-def _extract_sc1_rows(recs: List[dict], eta_label: str | None, start_index: int) -> List[Dict[str, Any]]:
+    if d is None:
+        return {}
+    pid = int(d.get("profile_id", 0))
+    return {
+        "profile_id": pid,
+        "profile": "R*" if pid == 1 else "R0",
+        "config_path": d.get("config_path", None),
+        "dt": float(d.get("dt", 0.0)),
+        "window_sec": float(d.get("window_sec", 0.0)),
+        "method": str(d.get("method", "")),
+        "p_lag": int(d.get("p_lag", 0)),
+        "mi_lag": int(d.get("mi_lag", 0)),
+        "Mmin_db": float(d.get("Mmin_db", 0.0)),
+        "epsilon": float(d.get("epsilon", 0.0)),
+        "tau_max": float(d.get("tau_max", 0.0)),
+        "seed_py": int(d.get("seed_py", 0)),
+        "seed_np": int(d.get("seed_np", 0)),
+        "omega": d.get("omega", None),
+        "omega_args": d.get("omega_args", {}),
+    }
+
+
+def _extract_sc1_rows(recs: List[dict], eta_label: str | None) -> List[Dict[str, Any]]:
     """Extract SC1 results into table rows.
 
     Args:
-        recs: Parsed audit records.
+        recs: Parsed audit records of the run being bundled.
         eta_label: Label for the `Ω` stimulus that produced these
             results (e.g., `"power_sag"`).
-        start_index: Only consider records from this index onward;
-            typically the index of the most recent `run_header`.
 
     Returns:
         List of dict rows ready for
@@ -116,9 +108,9 @@ def _extract_sc1_rows(recs: List[dict], eta_label: str | None, start_index: int)
         row contains `eta`, `delta`, `tau_rec`, `M_post`, and `pass`.
     """
     rows: List[Dict[str, Any]] = []
-    for r in recs[max(0, int(start_index)) :]:
+    for r in recs:
         if r.get("event") == "sc1_result":
-            d = r.get("details", {}) or {}
+            d = r.get("details") or {}
             row = {
                 "eta": str(eta_label or ""),
                 "delta": float(d.get("delta", 0.0)),
@@ -130,20 +122,6 @@ def _extract_sc1_rows(recs: List[dict], eta_label: str | None, start_index: int)
     return rows
 
 
-def _audit_hash_head(recs: List[dict]) -> str:
-    """Return the last hash value in the provided records or empty string.
-
-    Args:
-        recs: Parsed audit records.
-
-    Returns:
-        The last record's `hash` field, or `""` if the input is empty.
-    """
-    if not recs:
-        return ""
-    return str(recs[-1].get("hash", ""))
-
-
 def _pubkey_hash_or_none(pubkey_path: str) -> str | None:
     """Compute SHA-256 of a PEM public key file, if present.
 
@@ -156,18 +134,26 @@ def _pubkey_hash_or_none(pubkey_path: str) -> str | None:
         fingerprint of the device key without bundling the key itself.
     """
     try:
-        import hashlib
-
-        if not os.path.exists(pubkey_path):
-            return None
-        with open(pubkey_path, "rb") as f:
-            data = f.read()
-        return hashlib.sha256(data).hexdigest()
+        st = os.stat(pubkey_path)
+        return _sha256_file(pubkey_path, st.st_mtime_ns, st.st_size)
     except Exception:
         return None
 
 
-def bundle(artifact_dir: str, audit_path: str) -> Dict[str, str]:
+@lru_cache(maxsize=8)
+def _sha256_file(path: str, mtime_ns: int, size: int) -> str:
+    """SHA-256 of `path`, memoized on its `(mtime_ns, size)` stat signature.
+
+    Repeated bundles in a sweep hash the same key file; a changed file gets
+    a new signature and is re-read.
+    """
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def bundle(artifact_dir: str, audit_path: str, formats: Sequence[str] = ("png", "svg")) -> Dict[str, str]:
     """Create a verification artifact bundle from an audit log.
 
     Generates a paper-style timeline (PNG and SVG), an optional SC1 CSV
@@ -181,6 +167,10 @@ def bundle(artifact_dir: str, audit_path: str) -> Dict[str, str]:
             if missing.
         audit_path: Path to the JSONL audit log emitted by
             [`AuditLog`][ldtc.guardrails.audit.AuditLog].
+        formats: Timeline formats to render, any of `"png"` and
+            `"svg"`. Sweep drivers that only need the vector figure can
+            pass `("svg",)` to skip the raster render; skipped formats
+            are reported as `""`.
 
     Returns:
         Dict with keys for produced files: `timeline_png`,
@@ -189,36 +179,29 @@ def bundle(artifact_dir: str, audit_path: str) -> Dict[str, str]:
 
     Raises:
         FileNotFoundError: If the audit log is missing or empty.
+        ValueError: If `formats` names an unsupported format.
     """
     os.makedirs(artifact_dir, exist_ok=True)
-    recs = _read_audit(audit_path)
-    if not recs:
+    segment, header_details, hash_head = _scan_audit(audit_path)
+    if not segment:
         raise FileNotFoundError(f"No audit records at {audit_path}")
-    header, header_idx = _extract_header(recs)
+    header = _extract_header(header_details)
     eta = header.get("omega") or "trial"
     stamp = int(time.time())
 
-    seg_path = os.path.join(artifact_dir, f"audit_segment_{eta}_{stamp}.jsonl")
-    try:
-        with open(seg_path, "w", encoding="utf-8") as f:
-            for r in recs[max(0, header_idx) :]:
-                f.write(json.dumps(r, sort_keys=True) + "\n")
-        base = os.path.join(artifact_dir, f"timeline_{eta}_{stamp}")
-        tpaths = render_paper_timeline(
-            seg_path,
-            out_base_path=base,
-            sidecar_csv=None,
-            show=False,
-            footer_profile=str(header.get("profile", "R0")),
-            footer_audit_head=_audit_hash_head(recs),
-        )
-    finally:
-        try:
-            os.remove(seg_path)
-        except Exception:
-            pass
-
-    sc1_rows = _extract_sc1_rows(recs, eta_label=str(eta), start_index=header_idx)
+    base = os.path.join(artifact_dir, f"timeline_{eta}_{stamp}")
+    tpaths = render_paper_timeline(
+        audit_path,
+        out_base_path=base,
+        sidecar_csv=None,
+        show=False,
+        footer_profile=str(header.get("profile", "R0")),
+        footer_audit_head=hash_head,
+        records=segment,
+        formats=formats,
+    )
+
+    sc1_rows = _extract_sc1_rows(segment, eta_label=str(eta))
     table_path = ""
     if sc1_rows:
         table_path = os.path.join(artifact_dir, f"sc1_table_{eta}_{stamp}.csv")
@@ -242,7 +225,7 @@ def bundle(artifact_dir: str, audit_path: str) -> Dict[str, str]:
         "eta": eta,
         "eta_args": header.get("omega_args", {}),
         "ci_coverage": 0.95,
-        "audit_hash_head": _audit_hash_head(recs),
+        "audit_hash_head": hash_head,
         "indicator_schema": {
             "mq_step_db": 0.25,
             "mq_bits": 6,
@@ -261,17 +244,17 @@ def bundle(artifact_dir: str, audit_path: str) -> Dict[str, str]:
         if isinstance(cfg_src, str) and os.path.exists(cfg_src):
             base_name = os.path.basename(cfg_src)
             cfg_snap_path = os.path.join(artifact_dir, f"config_snapshot_{eta}_{stamp}_{base_name}")
-            with (
-                open(cfg_src, "r", encoding="utf-8") as f_in,
-                open(cfg_snap_path, "w", encoding="utf-8") as f_out,
-            ):
-                f_out.write(f_in.read())
+            shutil.copyfile(cfg_src, cfg_snap_path)
     except Exception:
         cfg_snap_path = None
 
     manifest_path = os.path.join(artifact_dir, f"manifest_{eta}_{stamp}.json")
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2, sort_keys=True)
+    # Serialize up front so the manifest lands in one write() instead of one
+    # per token. Bundles are not fsync'd; callers that need durability across
+    # a sweep should sync the output directory once at the end.
+    payload = json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8")
+    with open(manifest_path, "wb") as f:
+        f.write(payload)
     notice_path = os.path.join(artifact_dir, f"NOTICE_{eta}_{stamp}.txt")
     try:
         with open(notice_path, "w", encoding="utf-8") as nf:
@@ -15,9 +15,10 @@ See Also:
 from __future__ import annotations
 
 import csv
+from operator import itemgetter
 from typing import Any, Dict, List
 
-_BANNED_RAW_KEYS = {"L_loop", "L_ex", "ci_loop", "ci_ex"}
+_BANNED_RAW_KEYS = frozenset({"L_loop", "L_ex", "ci_loop", "ci_ex"})
 
 
 def _assert_no_raw_keys(rows: List[Dict[str, Any]]) -> None:
@@ -31,7 +32,7 @@ def _assert_no_raw_keys(rows: List[Dict[str, Any]]) -> None:
             `ci_ex`. The export is blocked before any file is written.
     """
     for r in rows:
-        if any(k in r for k in _BANNED_RAW_KEYS):
+        if not _BANNED_RAW_KEYS.isdisjoint(r):
             raise ValueError("raw LREG fields detected in reporting rows; export blocked")
 
 
@@ -49,14 +50,26 @@ def write_sc1_table(rows: List[Dict[str, Any]], out_csv: str) -> None:
         out_csv: Target CSV path. The file is created or overwritten.
 
     Raises:
-        ValueError: If any row contains a banned raw LREG field.
+        ValueError: If any row contains a banned raw LREG field, or a
+            field missing from the first row.
     """
     if not rows:
         return
-    _assert_no_raw_keys(rows)
     cols = list(rows[0].keys())
-    with open(out_csv, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=cols)
-        w.writeheader()
-        for r in rows:
-            w.writerow(r)
+    col_set = rows[0].keys()
+    if any(not r.keys() <= col_set for r in rows):
+        # Report a raw LREG field ahead of the generic schema error
+        _assert_no_raw_keys(rows)
+        # Same contract as csv.DictWriter's default extrasaction="raise"
+        raise ValueError("SC1 rows contain fields not in the first row's columns")
+    # Every row's keys are a subset of the first row's, so checking it covers all
+    _assert_no_raw_keys(rows[:1])
+    # Missing fields become "" (DictWriter's restval); one writerows call
+    # and a large buffer keep the per-row work in C
+    n = len(cols)
+    get_all = itemgetter(*cols) if n > 1 else (lambda r: (r[cols[0]],))
+    table = [get_all(r) if len(r) == n else tuple(r.get(c, "") for c in cols) for r in rows]
+    with open(out_csv, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        w = csv.writer(f)
+        w.writerow(cols)
+        w.writerows(table)
@@ -26,39 +26,122 @@ See Also:
 
 from __future__ import annotations
 
-import json
+import importlib.util
+import mmap
 import os
-from typing import Dict, List, Optional, Tuple
+import re
+import warnings
+from array import array
+from bisect import bisect_left
+from typing import AbstractSet, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
 
 from .style import COLORS, apply_matplotlib_theme
 
+if importlib.util.find_spec("orjson") is not None:
+    # Optional C decoder; orjson is not a required dependency
+    import orjson
 
-def _read_audit(path: str) -> List[dict]:
-    """Read a JSONL audit file, skipping malformed lines.
+    def _json_loads(b: bytes) -> Any:
+        return orjson.loads(b)
+
+else:
+    import json
+
+    def _json_loads(b: bytes) -> Any:
+        # json.loads detects the UTF-8 encoding of bytes itself
+        return json.loads(b)
+
+
+# Read size for streaming the audit log
+_AUDIT_CHUNK = 1 << 20
+# Audit files at least this large are memory-mapped instead of read in chunks
+_AUDIT_MMAP_MIN = 10 << 20
+# Longer series are reduced to a per-bucket min/max envelope before plotting
+_MAX_PLOT_POINTS = 4000
+# Figure formats render_paper_timeline can save, in save order
+_TIMELINE_FORMATS = ("png", "svg")
+# Audit events drawn as ticks when the caller does not choose its own
+_DEFAULT_TICK_EVENTS = frozenset({"partition_flip", "run_invalidated", "refusal_event"})
+
+
+def _audit_lines(path: str) -> Iterator[bytes]:
+    """Yield the raw lines of an audit file without decoding them.
+
+    Files of at least `_AUDIT_MMAP_MIN` bytes are memory-mapped and split
+    with `mmap.readline`, so the kernel page cache backs the scan and the
+    file is never copied into Python memory in bulk. Smaller files are
+    read in `_AUDIT_CHUNK` blocks. Lines may keep their trailing newline.
 
     Args:
         path: Path to the audit JSONL file.
 
-    Returns:
-        List of parsed records. A missing file yields an empty list;
+    Yields:
+        Raw line bytes in file order.
+    """
+    with open(path, "rb", buffering=0) as f:
+        if os.fstat(f.fileno()).st_size >= _AUDIT_MMAP_MIN:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield from iter(mm.readline, b"")
+            return
+        tail = b""
+        while True:
+            chunk = f.read(_AUDIT_CHUNK)
+            if not chunk:
+                break
+            lines = (tail + chunk).split(b"\n")
+            tail = lines.pop()
+            yield from lines
+        yield tail
+
+
+def _iter_audit(path: str, select: Optional[re.Pattern[bytes]] = None) -> Iterator[dict]:
+    """Stream records from a JSONL audit file, skipping malformed lines.
+
+    Lines come from [`_audit_lines`][ldtc.reporting.timeline._audit_lines]
+    as raw bytes, so no text decoding happens before the JSON parser
+    sees them.
+
+    Args:
+        path: Path to the audit JSONL file.
+        select: Optional compiled bytes pattern. When given, only lines
+            it matches (`search`) are parsed; the rest are dropped
+            without decoding. The first parseable record is
+            always yielded so callers can anchor relative timestamps.
+
+    Yields:
+        Parsed records in file order. A missing file yields nothing;
         malformed lines are silently skipped so a partially corrupted
         log still produces a useful timeline.
     """
-    out: List[dict] = []
     if not os.path.exists(path):
-        return out
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+        return
+    anchored = select is None
+    for line in _audit_lines(path):
+        if anchored and select is not None and select.search(line) is None:
+            continue
+        if line.strip():
             try:
-                out.append(json.loads(line))
-            except json.JSONDecodeError:
+                rec = _json_loads(line)
+            except ValueError:
                 continue
-    return out
+            anchored = True
+            yield rec
+
+
+def _read_audit(path: str) -> List[dict]:
+    """Read a JSONL audit file, skipping malformed lines.
+
+    Args:
+        path: Path to the audit JSONL file.
+
+    Returns:
+        List of parsed records; see
+        [`_iter_audit`][ldtc.reporting.timeline._iter_audit].
+    """
+    return list(_iter_audit(path))
 
 
 def render_verification_timeline(
@@ -108,7 +191,8 @@ def render_verification_timeline(
 def _parse_audit_for_timeseries(
     audit_path: str,
     include_tick_events: Optional[set[str]] = None,
-) -> Tuple[List[float], List[float], List[Tuple[float, float, str]], List[float]]:
+    records: Optional[Iterable[dict]] = None,
+) -> Tuple[array[float], array[float], List[Tuple[float, float, str]], List[float]]:
     """Extract per-window time, `M (dB)`, `Ω` spans, and audit tick times.
 
     Walks the JSONL audit for `window_measured` records (each records a
@@ -121,49 +205,167 @@ def _parse_audit_for_timeseries(
         include_tick_events: Optional set of event names to render as
             ticks. Defaults to `{"partition_flip", "run_invalidated",
             "refusal_event"}`.
+        records: Optional already-parsed records to use instead of
+            reading `audit_path`.
 
     Returns:
-        Tuple `(times_s, m_db, omega_spans, tick_times_s)` where each
-        list is in seconds relative to the first record.
+        Tuple `(times_s, m_db, omega_spans, tick_times_s)` with times in
+        seconds relative to the first record. The per-window series are
+        `array("d")` buffers, which NumPy wraps without a per-element
+        conversion.
     """
-    recs = _read_audit(audit_path)
-    if not recs:
-        return [], [], [], []
-    ts0 = recs[0]["ts"]
-    t_series: List[float] = []
-    m_db_series: List[float] = []
+    t_series: array[float] = array("d")
+    m_db_series: array[float] = array("d")
     omega_spans: List[Tuple[float, float, str]] = []
     tick_times: List[float] = []
 
     pending_omega: Dict[str, float] = {}
-    include_tick_events = include_tick_events or {
-        "partition_flip",
-        "run_invalidated",
-        "refusal_event",
-    }
-    for r in recs:
-        t = float(r["ts"] - ts0)
+    tick_events: AbstractSet[str] = include_tick_events or _DEFAULT_TICK_EVENTS
+    # Event names repeat heavily, so classify each distinct name once:
+    # (is M window, Ω start/stop key or "", is tick).
+    kinds: Dict[str, Tuple[bool, str, bool]] = {}
+    if records is None:
+        # Quoted event values; other lines never reach the JSON parser
+        needles = [f'"{ev}"'.encode() for ev in tick_events] + [b'"window_measured"', b'"omega_']
+        records = _iter_audit(audit_path, select=re.compile(b"|".join(map(re.escape, needles))))
+    ts0 = None
+    for r in records:
+        if ts0 is None:
+            ts0 = r["ts"]
         ev = r.get("event", "")
-        det = r.get("details", {}) or {}
-        if ev == "window_measured":
+        kind = kinds.get(ev)
+        if kind is None:
+            span = ""
+            if ev.startswith("omega_"):
+                if ev.endswith("_start"):
+                    span = "start"
+                elif ev.endswith("_stop"):
+                    span = "stop"
+            kind = kinds[ev] = (ev == "window_measured", span, ev in tick_events)
+        is_window, span, is_tick = kind
+        if not (is_window or span or is_tick):
+            continue
+        t = float(r["ts"] - ts0)
+        if is_window:
             try:
-                m = float(det.get("M", 0.0))
+                m = float((r.get("details") or {}).get("M", 0.0))
                 t_series.append(t)
                 m_db_series.append(m)
             except Exception:
                 pass
-        if ev.endswith("_start") and ev.startswith("omega_"):
+        if span == "start":
             pending_omega[ev] = t
-        elif ev.endswith("_stop") and ev.startswith("omega_"):
-            base = ev.replace("_stop", "_start")
-            t0 = pending_omega.pop(base, None)
+        elif span == "stop":
+            t0 = pending_omega.pop(ev.replace("_stop", "_start"), None)
             if t0 is not None:
                 omega_spans.append((t0, t, ev))
-        if ev in include_tick_events:
+        if is_tick:
             tick_times.append(t)
     return t_series, m_db_series, omega_spans, tick_times
 
 
+def _envelope_indices(y: np.ndarray, max_points: int = _MAX_PLOT_POINTS) -> np.ndarray:
+    """Indices of a min/max envelope of `y` in at most `max_points` buckets.
+
+    Keeps the first and last sample plus the argmin and argmax of each
+    equal-width bucket, in time order, so peaks and dips survive while
+    matplotlib draws at most `2 * max_points + 2` vertices. Series that
+    already fit are returned whole.
+
+    Args:
+        y: 1-D series to decimate.
+        max_points: Number of buckets.
+
+    Returns:
+        Sorted, unique indices into `y`.
+    """
+    n = y.shape[0]
+    if n <= max_points:
+        return np.arange(n)
+    w = -(-n // max_points)
+    nb = -(-n // w)
+    # Pad the last bucket with its final value; argmin/argmax ties resolve to
+    # the real sample first, and any padded hit is clipped back onto it.
+    buckets = np.concatenate([y, np.full(nb * w - n, y[-1])]).reshape(nb, w)
+    base = np.arange(nb) * w
+    lo = np.minimum(base + buckets.argmin(axis=1), n - 1)
+    hi = np.minimum(base + buckets.argmax(axis=1), n - 1)
+    return np.unique(np.concatenate(([0, n - 1], lo, hi)))
+
+
+def _read_sidecar(path: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Load normalized `(time_s, L_loop, L_ex)` columns from a sidecar CSV.
+
+    Well-formed numeric files go through `numpy.loadtxt` in one call.
+    Anything it rejects (missing time column, blank or quoted cells) falls
+    back to a per-row parse that skips rows with unparseable values.
+
+    Args:
+        path: CSV with a header naming `time_s` (or `t`), `L_loop`, and
+            `L_ex`.
+
+    Returns:
+        Tuple of equal-length float arrays `(time_s, L_loop, L_ex)`.
+    """
+    import csv
+
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        header = next(csv.reader(f), [])
+        cols = {name: i for i, name in enumerate(header)}
+        ti = cols.get("time_s", cols.get("t"))
+        if ti is not None and "L_loop" in cols and "L_ex" in cols:
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", UserWarning)  # header-only file
+                    arr = np.loadtxt(f, delimiter=",", usecols=(ti, cols["L_loop"], cols["L_ex"]), dtype=float, ndmin=2)
+                return arr[:, 0], arr[:, 1], arr[:, 2]
+            except ValueError:
+                f.seek(0)
+        else:
+            f.seek(0)
+        rows: List[Tuple[float, float, float]] = []
+        for row in csv.DictReader(f):
+            try:
+                rows.append((float(row.get("time_s", row.get("t", "0"))), float(row["L_loop"]), float(row["L_ex"])))
+            except Exception:
+                continue
+    arr = np.array(rows, dtype=float).reshape(-1, 3)
+    return arr[:, 0], arr[:, 1], arr[:, 2]
+
+
+def _thin_ticks(tick_times: Iterable[float], spacing: float) -> List[float]:
+    """Greedily keep ticks at least `spacing` seconds after the last kept one.
+
+    Jumps between kept ticks with a binary search, so the cost scales with
+    the number of ticks drawn rather than the number recorded.
+
+    Args:
+        tick_times: Tick times in seconds, in any order.
+        spacing: Minimum gap between kept ticks; negative values act as `0`.
+
+    Returns:
+        Sorted kept tick times.
+    """
+    t = sorted(tick_times)
+    spacing = max(0.0, spacing)
+    if spacing == 0.0:
+        return t
+    n = len(t)
+    out: List[float] = []
+    i = 0
+    while i < n:
+        last = t[i]
+        out.append(last)
+        j = bisect_left(t, last + spacing, i + 1)
+        # Settle rounding in `last + spacing` against the exact gap test
+        while j > i + 1 and t[j - 1] - last >= spacing:
+            j -= 1
+        while j < n and t[j] - last < spacing:
+            j += 1
+        i = j
+    return out
+
+
 def render_paper_timeline(
     audit_path: str,
     out_base_path: str,
@@ -173,6 +375,8 @@ def render_paper_timeline(
     use_log_L: bool = True,
     footer_profile: Optional[str] = None,
     footer_audit_head: Optional[str] = None,
+    records: Optional[Sequence[dict]] = None,
+    formats: Sequence[str] = _TIMELINE_FORMATS,
 ) -> Dict[str, str]:
     """Render a paper-style timeline of `𝓛` traces and `M (dB)`.
 
@@ -195,55 +399,62 @@ def render_paper_timeline(
             Inferred from the audit `run_header` when omitted.
         footer_audit_head: Optional last-hash value for audit
             provenance. Inferred from the last record when omitted.
+        records: Optional already-parsed audit records. When given,
+            they are used in place of reading `audit_path`, so callers
+            holding a run in memory need not write it back to disk.
+        formats: Output formats to save, any of `"png"` and `"svg"`.
+            Each format is a full backend render, so sweeps that only
+            need the vector figure can pass `("svg",)`.
 
     Returns:
-        Dict with keys `"png"` and `"svg"` pointing to the saved figure
-        paths.
+        Dict mapping each requested format (`"png"`, `"svg"`) to the
+        saved figure path.
 
     Raises:
         FileNotFoundError: If per-window `M` data are absent in the
             audit log (no `window_measured` events).
+        ValueError: If `formats` names an unsupported format.
     """
-    t_series, m_db_series, omega_spans, tick_times = _parse_audit_for_timeseries(audit_path)
+    bad = set(formats) - set(_TIMELINE_FORMATS)
+    if bad:
+        raise ValueError(f"Unsupported timeline format(s): {sorted(bad)}")
+    t_series, m_db_series, omega_spans, tick_times = _parse_audit_for_timeseries(audit_path, records=records)
     if not t_series or not m_db_series:
         raise FileNotFoundError("No per-window M data found in audit; ensure 'window_measured' events are present.")
 
-    l_time: List[float] = []
-    l_loop: List[float] = []
-    l_ex: List[float] = []
+    l_time_arr = l_loop_arr = l_ex_arr = np.empty(0)
     if sidecar_csv and os.path.exists(sidecar_csv):
-        import csv
-
-        with open(sidecar_csv, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    l_time.append(float(row.get("time_s", row.get("t", "0"))))
-                    l_loop.append(float(row["L_loop"]))
-                    l_ex.append(float(row["L_ex"]))
-                except Exception:
-                    continue
-
-    if not l_time:
-        l_time = t_series
-        l_ex = [1.0 for _ in m_db_series]
-        l_loop = [10.0 ** (m / 10.0) for m in m_db_series]
+        l_time_arr, l_loop_arr, l_ex_arr = _read_sidecar(sidecar_csv)
+
+    t_arr = np.frombuffer(t_series, dtype=float)
+    m_arr = np.frombuffer(m_db_series, dtype=float)
+    keep = _envelope_indices(m_arr)
+    t_arr, m_arr = t_arr[keep], m_arr[keep]
+
+    if l_time_arr.size:
+        keep = np.union1d(_envelope_indices(l_loop_arr), _envelope_indices(l_ex_arr))
+        l_time_arr, l_loop_arr, l_ex_arr = l_time_arr[keep], l_loop_arr[keep], l_ex_arr[keep]
+    else:
+        # L_loop = 10^(M/10) is monotone in M, so M's envelope is also L's
+        l_time_arr = t_arr
+        l_ex_arr = np.ones_like(m_arr)
+        l_loop_arr = 10.0 ** (m_arr / 10.0)
 
     apply_matplotlib_theme("paper")
 
     fig, ax_l = plt.subplots(figsize=(7.0, 3.2))
     ax_m = ax_l.twinx()
 
-    ax_l.plot(l_time, l_loop, label="L_loop (norm)", color=COLORS["green"], linewidth=1.8)
-    ax_l.plot(l_time, l_ex, label="L_exchange (norm)", color=COLORS["gray"], linewidth=1.8)
+    ax_l.plot(l_time_arr, l_loop_arr, label="L_loop (norm)", color=COLORS["green"], linewidth=1.8)
+    ax_l.plot(l_time_arr, l_ex_arr, label="L_exchange (norm)", color=COLORS["gray"], linewidth=1.8)
     if use_log_L:
         ax_l.set_yscale("log")
     ax_l.set_xlabel("Time (s)")
     ax_l.set_ylabel("L (a.u.)")
 
     ax_m.plot(
-        t_series,
-        m_db_series,
+        t_arr,
+        m_arr,
         label="M (dB)",
         color=COLORS["yellow"],
         linewidth=1.6,
@@ -261,10 +472,7 @@ def render_paper_timeline(
         )
 
     if tick_times:
-        thinned: List[float] = []
-        for tt in sorted(tick_times):
-            if not thinned or (tt - thinned[-1]) >= max(0.0, float(min_tick_spacing_s)):
-                thinned.append(tt)
+        thinned = _thin_ticks(tick_times, float(min_tick_spacing_s))
         ax_l.vlines(
             thinned,
             [0.96] * len(thinned),
@@ -281,7 +489,7 @@ def render_paper_timeline(
     ax_l.legend(handles_l + handles_m, labels_l + labels_m, loc="upper right", frameon=False)
 
     try:
-        m_min, m_max = min(m_db_series), max(m_db_series)
+        m_min, m_max = float(m_arr.min()), float(m_arr.max())
         lo = 0.0 if m_min >= 0 else m_min - 2.0
         hi = 120.0 if m_max <= 120.0 else m_max + 5.0
         ax_m.set_ylim(lo, hi)
@@ -290,17 +498,17 @@ def render_paper_timeline(
 
     try:
         if footer_profile is None or footer_audit_head is None:
-            recs = _read_audit(audit_path)
             prof = None
-            for r in recs:
-                if r.get("event") == "run_header":
-                    d = r.get("details", {}) or {}
+            last = None
+            for r in _iter_audit(audit_path) if records is None else records:
+                if prof is None and r.get("event") == "run_header":
+                    d = r.get("details") or {}
                     pid = int(d.get("profile_id", 0))
                     prof = "R*" if pid == 1 else "R0"
-                    break
+                last = r
             footer_profile = footer_profile or (prof or "R0")
-            if footer_audit_head is None and recs:
-                footer_audit_head = str(recs[-1].get("hash", ""))
+            if footer_audit_head is None and last is not None:
+                footer_audit_head = str(last.get("hash", ""))
         if footer_profile or footer_audit_head:
             head_short = (footer_audit_head or "")[:12]
             footer_txt = f"Profile: {footer_profile or ''}    Audit head: {head_short}"
@@ -318,11 +526,10 @@ def render_paper_timeline(
         pass
 
     fig.tight_layout()
-    out_png = f"{out_base_path}.png"
-    out_svg = f"{out_base_path}.svg"
-    fig.savefig(out_png)
-    fig.savefig(out_svg)
+    out = {fmt: f"{out_base_path}.{fmt}" for fmt in _TIMELINE_FORMATS if fmt in formats}
+    for path in out.values():
+        fig.savefig(path)
     if show:
         plt.show()
     plt.close(fig)
-    return {"png": out_png, "svg": out_svg}
+    return out
@@ -10,8 +10,8 @@ See Also:
 
 from __future__ import annotations
 
-from collections import deque
-from typing import Deque, Dict, List
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple
 
 import numpy as np
 
@@ -19,9 +19,10 @@ import numpy as np
 class SlidingWindow:
     """Fixed-length, per-channel sliding window.
 
-    Maintains a `deque` per channel and exposes a dense matrix view when
-    the window is full. Useful for streaming estimators that require a
-    fixed-size time-by-signal buffer.
+    Keeps the samples in one preallocated `(capacity, N)` ring buffer and
+    exposes a dense, chronologically ordered matrix copy when the window
+    is full. Useful for streaming estimators that require a fixed-size
+    time-by-signal buffer.
 
     Args:
         capacity: Number of samples to retain per channel.
@@ -38,7 +39,7 @@ class SlidingWindow:
     """
 
     def __init__(self, capacity: int, channel_order: List[str]) -> None:
-        """Initialize per-channel deques.
+        """Initialize the ring buffer.
 
         Args:
             capacity: Maximum number of samples to retain per channel.
@@ -47,7 +48,10 @@ class SlidingWindow:
         """
         self.capacity = capacity
         self.order = channel_order
-        self.buffers: Dict[str, Deque[float]] = {k: deque(maxlen=capacity) for k in channel_order}
+        self._buf = np.zeros((capacity, len(channel_order)), dtype=np.float64)
+        # Row the next sample goes to, and number of valid rows
+        self._head = 0
+        self._count = 0
 
     def append(self, sample: Dict[str, float]) -> None:
         """Append one sample across all channels.
@@ -56,34 +60,44 @@ class SlidingWindow:
             sample: Mapping of channel name to scalar reading. Missing
                 channels default to `0.0`.
         """
-        for k in self.order:
-            self.buffers[k].append(float(sample.get(k, 0.0)))
+        if not self.capacity:
+            return
+        get = sample.get
+        self._buf[self._head] = [float(get(k, 0.0)) for k in self.order]
+        self._head = (self._head + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
 
     def ready(self) -> bool:
-        """Return `True` once every channel deque is full."""
-        return all(len(self.buffers[k]) == self.capacity for k in self.order)
+        """Return `True` once the window holds `capacity` samples."""
+        return self._count == self.capacity
 
     def get_matrix(self) -> np.ndarray:
         """Return the current window as a dense `(T, N)` matrix.
 
         Returns:
-            Numpy array of shape `(capacity, len(channel_order))`.
+            Numpy array of shape `(capacity, len(channel_order))`, oldest
+            sample first. The array is a fresh copy, unaffected by later
+            appends.
 
         Raises:
             RuntimeError: If the window is not yet full.
         """
         if not self.ready():
             raise RuntimeError("SlidingWindow not yet full")
-        arrs = [np.asarray(self.buffers[k], dtype=float) for k in self.order]
-        return np.column_stack(arrs)
+        h = self._head
+        if h == 0:
+            return self._buf.copy()
+        # Unroll the ring with a single copy
+        return np.concatenate((self._buf[h:], self._buf[:h]), axis=0)
 
     def clear(self) -> None:
         """Drop all buffered samples across every channel."""
-        for dq in self.buffers.values():
-            dq.clear()
+        self._head = 0
+        self._count = 0
 
 
-def block_bootstrap_indices(n: int, block: int, draws: int) -> List[np.ndarray]:
+def block_bootstrap_indices(n: int, block: int, draws: int, seed: int | None = None) -> List[np.ndarray]:
     """Circular block-bootstrap indices for time series.
 
     Generates `draws` index arrays, each of length `n`, by stitching
@@ -96,20 +110,38 @@ def block_bootstrap_indices(n: int, block: int, draws: int) -> List[np.ndarray]:
         n: Length of the time series.
         block: Block length for resampling.
         draws: Number of bootstrap replicates to generate.
+        seed: Optional seed. When given, the indices come from a dedicated
+            generator instead of NumPy's global one, so the same arguments
+            always yield the same draws; these are cached and returned as
+            read-only arrays.
 
     Returns:
         List of index arrays (each of length `n`) representing bootstrap
         samples with circular wrapping at boundaries.
     """
-    idxs: List[np.ndarray] = []
-    for _ in range(draws):
-        i = 0
-        out = []
-        while i < n:
-            start = np.random.randint(0, n)
-            take = min(block, n - i)
-            sel = (np.arange(take) + start) % n
-            out.append(sel)
-            i += take
-        idxs.append(np.concatenate(out))
-    return idxs
+    if seed is not None:
+        return list(_seeded_block_bootstrap_indices(int(n), int(block), int(draws), int(seed)))
+    return _draw_block_indices(n, block, draws, np.random.randint)
+
+
+@lru_cache(maxsize=32)
+def _seeded_block_bootstrap_indices(n: int, block: int, draws: int, seed: int) -> Tuple[np.ndarray, ...]:
+    """Cached, read-only draws for a fixed `(n, block, draws, seed)`."""
+    idxs = _draw_block_indices(n, block, draws, np.random.RandomState(seed).randint)
+    for idx in idxs:
+        idx.setflags(write=False)
+    return tuple(idxs)
+
+
+def _draw_block_indices(n: int, block: int, draws: int, randint: Callable[..., np.ndarray]) -> List[np.ndarray]:
+    """Draw circular block-bootstrap indices with the given `randint`.
+
+    All block starts come from one `randint(0, n, size=(draws, nb))` call,
+    which consumes the generator exactly like `draws * nb` scalar calls in
+    row-major order, so draws match a per-block loop for the same state.
+    """
+    nb = -(-n // block)
+    starts = randint(0, n, size=(draws, nb))
+    # (draws, nb, block) -> (draws, nb * block), trimming the last block to n
+    idx = (starts[:, :, None] + np.arange(block)) % n
+    return list(idx.reshape(draws, nb * block)[:, :n])
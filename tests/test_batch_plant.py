@@ -0,0 +1,48 @@
+"""Tests: vectorized plant replicas.
+
+Checks that BatchPlant follows the scalar Plant dynamics and that Ω hooks
+only touch the selected replicas.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from ldtc.plant import models
+from ldtc.plant.batch_models import BatchPlant
+from ldtc.plant.models import Action, Plant
+
+
+def test_batch_plant_matches_scalar_without_noise(monkeypatch):
+    """With noise disabled, every replica should track the scalar plant exactly."""
+    # Midpoint draws make every uniform noise term exactly zero
+    monkeypatch.setattr(models.random, "random", lambda: 0.5)
+    plant = Plant()
+    batch = BatchPlant(K=3, seed=0)
+    batch._noise[:] = 0.0
+    plant.command("hard_shutdown")
+    batch.command("hard_shutdown")
+    for k in range(20):
+        act = Action(throttle=0.3, cool=0.1 * (k % 3), repair=0.2, accept_cmd=k >= 5)
+        plant.step(act)
+        batch.step(throttle=act.throttle, cool=act.cool, repair=act.repair, accept_cmd=act.accept_cmd)
+    state = batch.read_state()
+    for key, val in plant.read_state().items():
+        assert np.allclose(state[key], val)
+
+
+def test_batch_plant_omega_on_subset():
+    """Ω hooks should perturb only the indexed replicas and keep states bounded."""
+    batch = BatchPlant(K=4, seed=1)
+    old, new = batch.apply_power_sag(0.5, idx=[1, 3])
+    assert np.allclose(new, old * 0.5)
+    assert batch.H[0] == batch.H[2] == old[0]
+    batch.spike_ingress(10.0, idx=slice(0, 2))
+    assert np.all(batch.demand[:2] == 1.0) and batch.demand[2] < 1.0
+    out = batch.apply_omega("ingress_flood", idx=np.array([False, False, True, False]), mult=1.5)
+    assert out["demand"].shape == (1,)
+    for _ in range(50):
+        batch.step(throttle=np.linspace(0.0, 1.0, 4))
+    for arr in batch.read_state().values():
+        assert arr.shape == (4,)
+    assert np.all((batch.E >= 0.0) & (batch.E <= 1.0))
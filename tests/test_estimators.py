@@ -6,6 +6,7 @@ Covers SC1 pass/fail logic and basic shape/non-negativity of estimates.
 from __future__ import annotations
 
 import numpy as np
+import pytest
 
 from ldtc.lmeas.estimators import estimate_L
 from ldtc.lmeas.metrics import sc1_evaluate
@@ -80,3 +81,92 @@ def test_estimate_L_shapes():
     res = estimate_L(X, C=[0], Ex=[1], method="linear", p=2, n_boot=8)
     assert res.L_loop >= 0.0
     assert res.L_ex >= 0.0
+
+
+def test_linear_batch_matches_per_series():
+    """Batched linear estimator should agree with evaluating each series alone."""
+    from ldtc.lmeas.estimators import (
+        _dir_influence_linear_conditional,
+        _dir_influence_linear_conditional_batch,
+    )
+
+    rng = np.random.default_rng(1)
+    xb = rng.normal(size=(5, 200, 4))
+    batch = _dir_influence_linear_conditional_batch(xb, p=2, add_sources=[0, 1], base_sources=[2, 3], targets=[0, 1])
+    single = [
+        _dir_influence_linear_conditional(x, p=2, add_sources=[0, 1], base_sources=[2, 3], targets=[0, 1]) for x in xb
+    ]
+    assert np.allclose(batch, single)
+
+
+def test_estimate_L_parallel_matches_serial():
+    """Parallel workers should reproduce the serial linear estimates and CIs."""
+    rng = np.random.default_rng(2)
+    X = rng.normal(size=(240, 4))
+    np.random.seed(3)
+    serial = estimate_L(X, C=[0, 1], Ex=[2, 3], method="linear", p=2, n_boot=8)
+    np.random.seed(3)
+    threaded = estimate_L(X, C=[0, 1], Ex=[2, 3], method="linear", p=2, n_boot=8, n_jobs=2)
+    assert threaded.L_loop == serial.L_loop and threaded.L_ex == serial.L_ex
+    assert np.allclose(threaded.ci_loop, serial.ci_loop)
+    assert np.allclose(threaded.ci_ex, serial.ci_ex)
+
+
+def test_estimate_L_seeded_bootstrap_is_reproducible():
+    """A bootstrap seed should give identical CIs without touching the global RNG."""
+    rng = np.random.default_rng(4)
+    X = rng.normal(size=(160, 4))
+    np.random.seed(0)
+    before = np.random.get_state(legacy=True)
+    assert isinstance(before, tuple)
+    a = estimate_L(X, C=[0, 1], Ex=[2, 3], method="linear", p=2, n_boot=8, seed=11)
+    b = estimate_L(X, C=[0, 1], Ex=[2, 3], method="linear", p=2, n_boot=8, seed=11)
+    assert a.ci_loop == b.ci_loop and a.ci_ex == b.ci_ex
+    after = np.random.get_state(legacy=True)
+    assert isinstance(after, tuple)
+    assert np.array_equal(after[1], before[1])
+
+
+def test_linear_handles_collinear_baseline():
+    """A duplicated baseline signal should not change the partial R² of the added sources."""
+    from ldtc.lmeas.estimators import _dir_influence_linear_conditional
+
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(100, 4))
+    x[:, 3] = x[:, 2]
+    dup = _dir_influence_linear_conditional(x, 2, add_sources=[0, 1], base_sources=[2, 3], targets=[0, 1])
+    ref = _dir_influence_linear_conditional(x[:, :3], 2, add_sources=[0, 1], base_sources=[2], targets=[0, 1])
+    assert np.isclose(dup, ref, rtol=1e-8)
+
+
+def test_linear_added_source_in_baseline_span_adds_nothing():
+    """An added source duplicating a baseline source explains no extra variance."""
+    from ldtc.lmeas.estimators import _dir_influence_linear_conditional
+
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(80, 3))
+    x[:, 1] = x[:, 0]
+    assert _dir_influence_linear_conditional(x, 1, add_sources=[1], base_sources=[0], targets=[0]) == 0.0
+    x[:, 1] = 2.5 * x[:, 2]
+    assert _dir_influence_linear_conditional(x, 2, add_sources=[1], base_sources=[2], targets=[0]) == 0.0
+
+
+@pytest.mark.parametrize("ties", ["rounded", "resampled"])
+def test_mi_matches_sklearn_with_ties(ties):
+    """Seed-averaged MI agrees with per-pair `mutual_info_regression` when samples are tied."""
+    from sklearn.feature_selection import mutual_info_regression
+
+    from ldtc.lmeas.estimators import _dir_influence_mi
+
+    rng = np.random.default_rng(0)
+    T = 200
+    x = rng.normal(size=(T, 3))
+    x[1:, 0] += 0.8 * x[:-1, 1]
+    # Rounded telemetry, or a window with rows repeated as in a block bootstrap
+    w = np.round(x, 1) if ties == "rounded" else x[np.sort(rng.integers(0, T, T))]
+    ours, ref = [], []
+    for seed in range(20):
+        np.random.seed(seed)
+        ours.append(_dir_influence_mi(w, sources=[1, 2], targets=[0]))
+        ref.append(np.mean([mutual_info_regression(w[:-1, [s]], w[1:, 0], random_state=seed)[0] for s in (1, 2)]))
+    assert abs(np.mean(ours) - np.mean(ref)) < 0.01
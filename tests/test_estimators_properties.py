@@ -90,7 +90,9 @@ def test_bootstrap_ci_shrinks_with_more_samples():
 def test_mi_and_linear_estimators_agree_on_linear_system():
     """Different estimators should share the monotonic trend on linear data."""
     # Both estimators should reflect the same ordering as intra-loop coupling increases
-    ks = [0.1, 0.4, 0.7]
+    # Keep a_self + c_intra < 1: an explosive loop overflows float64 precision,
+    # leaving only rounding residue for any estimator to measure
+    ks = [0.1, 0.3, 0.5]
     Ms_lin = []
     Ms_mi = []
     Ms_ksg = []
@@ -5,7 +5,10 @@ Exercises LREG derivation, Δt rate limits, audit chain checks, and jitter.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import time
+from dataclasses import asdict
 
 from ldtc.guardrails.audit import AuditLog
 from ldtc.guardrails.dt_guard import DeltaTGuard, DtGuardConfig
@@ -96,6 +99,26 @@ def test_audit_chain_and_raw_lreg_detection(tmp_path):
     assert audit_contains_raw_lreg_values(str(audit2_path)) is True
 
 
+def test_audit_lines_match_canonical_json_and_hash(tmp_path):
+    """Stored lines equal the record's canonical JSON, and hash covers everything but "hash"."""
+    audit_path = tmp_path / "audit.jsonl"
+    audit = AuditLog(str(audit_path))
+    tricky = ', "prev_hash": "GENESIS"'
+    recs = [
+        audit.append("start", {}),
+        audit.append(f"evt{tricky}", {"note": tricky, "Ω": "ünïcødé 😀", "nest": {"prev_hash": tricky}}),
+        audit.append("tick", {"M": 1e-05, "vals": [1, 2.5, None, True], "s": 'a"b\\c\nd'}),
+    ]
+    lines = audit_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == len(recs)
+    for line, rec in zip(lines, recs):
+        assert line == json.dumps(asdict(rec), sort_keys=True)
+        body = json.loads(line)
+        body.pop("hash")
+        assert hashlib.sha256(json.dumps(body, sort_keys=True).encode("utf-8")).hexdigest() == rec.hash
+    assert audit_chain_broken(str(audit_path)) is False
+
+
 def test_scheduler_jitter_p95_within_bounds(tmp_path):
     """Scheduler jitter p95 should be within bounds; audit should record metrics."""
     audit_path = tmp_path / "audit_jitter.jsonl"
@@ -20,3 +20,14 @@ def test_omega_calls():
     assert "demand" in r2
     r3 = conflict(a)
     assert r3["cmd"] == "hard_shutdown"
+
+
+def test_adapter_snapshot_tracks_writes():
+    """read_snapshot should return the published tuple and agree with read_state."""
+    a = PlantAdapter()
+    before = a.read_snapshot()
+    sag(a, drop=0.5)
+    snap = a.read_snapshot()
+    assert snap is a.read_snapshot()
+    assert snap.H == before.H * 0.5
+    assert snap.as_dict() == a.read_state()
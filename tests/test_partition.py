@@ -5,7 +5,10 @@ Ensures updates occur only after sufficient ΔM and required streak.
 
 from __future__ import annotations
 
-from ldtc.lmeas.partition import PartitionManager
+import numpy as np
+
+from ldtc.lmeas.estimators import estimate_L
+from ldtc.lmeas.partition import PartitionManager, greedy_suggest_C
 
 
 def test_partition():
@@ -31,3 +34,32 @@ def test_partition():
     pm.maybe_regrow([0, 1, 2, 3], delta_M_db=1.0, delta_M_min_db=0.5, consecutive_required=1)
     p5 = pm.get()
     assert set(p5.C) == {0, 1, 2}
+
+
+def test_greedy_linear_fast_path_matches_estimator():
+    """Linear candidate scoring on the factored window should match estimate_L."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 6))
+    X[1:, 3] += 0.8 * X[:-1, 0]
+    X[1:, 5] += 0.5 * X[:-1, 3]
+    kw = dict(C=[0, 1], Ex=[2, 3, 4, 5], method="linear", p=2, n_boot_candidates=8)
+    np.random.seed(1)
+    fast = greedy_suggest_C(X, estimator=estimate_L, **kw)
+    np.random.seed(1)
+    slow = greedy_suggest_C(X, estimator=lambda **k: estimate_L(**k), **kw)
+    assert fast[0] == slow[0]
+    assert np.isclose(fast[1], slow[1])
+    assert np.allclose(fast[2]["step_gains"], slow[2]["step_gains"])
+
+
+def test_greedy_linear_fast_path_matches_estimator_with_duplicate_channel():
+    """An exchange channel duplicating a loop channel should not split the fast and slow paths."""
+    for seed in range(20):
+        rng = np.random.default_rng(seed)
+        X = rng.normal(size=(int(rng.choice([40, 100, 200])), 4))
+        X[:, int(rng.integers(1, 4))] = X[:, 0]
+        kw = dict(C=[0], Ex=[1, 2, 3], method="linear", p=3, n_boot_candidates=0)
+        fast = greedy_suggest_C(X, estimator=estimate_L, **kw)
+        slow = greedy_suggest_C(X, estimator=lambda **k: estimate_L(**k), **kw)
+        assert fast[0] == slow[0]
+        assert np.allclose(fast[2]["step_gains"], slow[2]["step_gains"])
@@ -7,10 +7,14 @@ from __future__ import annotations
 
 import json
 import math
+import multiprocessing
 import socket
+import struct
 import time
 
-from ldtc.plant.hw_adapter import HardwarePlantAdapter
+import pytest
+
+from ldtc.plant.hw_adapter import _FRAME_MAGIC, HardwarePlantAdapter, _seal_frame, _split_serial
 from ldtc.plant.models import Action
 
 
@@ -59,3 +63,113 @@ def test_hw_adapter_udp_ingest_and_read_state():
             sock.close()
         except Exception:
             pass
+
+
+def test_hw_adapter_udp_binary_frames():
+    """Binary telemetry frames decode in state_keys order; JSON still parses; actuators go out framed."""
+    tmp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    tmp.bind(("127.0.0.1", 0))
+    host, port = tmp.getsockname()
+    tmp.close()
+    ctrl = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    ctrl.bind(("127.0.0.1", 0))
+    ctrl.settimeout(1.0)
+    ctrl_host, ctrl_port = ctrl.getsockname()
+
+    adapter = HardwarePlantAdapter(
+        transport="udp",
+        udp_bind_host=host,
+        udp_bind_port=port,
+        udp_control_host=ctrl_host,
+        udp_control_port=ctrl_port,
+        telemetry_timeout_sec=1.0,
+        binary=True,
+    )
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        msg = {"E": 0.5, "T": 0.25, "R": 0.75, "demand": 0.125, "io": 0.375, "H": 0.0625}
+        sock.sendto(_seal_frame(struct.pack("<2sB6f", _FRAME_MAGIC, 6, *msg.values())), (host, port))
+        t0 = time.time()
+        state = adapter.read_state()
+        while time.time() - t0 < 1.5 and math.isnan(state["H"]):
+            time.sleep(0.01)
+            state = adapter.read_state()
+        assert state == msg
+
+        # A JSON packet the size of an unframed <6f payload must not be read as floats
+        packet = b'{"E":0.5,"T":0.25,"R":1}'
+        assert len(packet) == struct.calcsize("<6f")
+        sock.sendto(packet, (host, port))
+        t0 = time.time()
+        while time.time() - t0 < 1.5 and adapter.read_state()["R"] != 1.0:
+            time.sleep(0.01)
+        assert adapter.read_state() == {**msg, "E": 0.5, "T": 0.25, "R": 1.0}
+
+        adapter.write_actuators(Action(throttle=0.5, cool=0.25, repair=0.0, accept_cmd=True))
+        data, _addr = ctrl.recvfrom(64)
+        assert data == _seal_frame(struct.pack("<2sB4f", _FRAME_MAGIC, 4, 0.5, 0.25, 0.0, 1.0))
+    finally:
+        adapter.close()
+        sock.close()
+        ctrl.close()
+
+
+def test_split_serial_resyncs_after_corruption():
+    """Serial frames survive a dropped byte, a bad header, embedded newlines, and interleaved JSON."""
+    head = _FRAME_MAGIC + bytes([6])
+    # 1.4e-44 packs to 0x0a 0x00 0x00 0x00, putting a newline byte inside the payload
+    good = _seal_frame(struct.pack("<2sB6f", _FRAME_MAGIC, 6, 0.5, 1.4e-44, 0.25, 0.75, 0.125, 1.0))
+    assert b"\n" in good[3:]
+    broken = good[:10] + good[11:]  # one byte lost mid-frame
+    line = b'{"E": 0.5}'
+    stream = good + broken + good + line + b"\n" + good + _FRAME_MAGIC + b"\x02" + good
+
+    msgs, rest = [], b""
+    for k in range(0, len(stream), 7):  # arbitrary read boundaries
+        out, rest = _split_serial(rest + stream[k : k + 7], head, len(good))
+        msgs.extend(out)
+    assert rest == b""
+    # The damaged frame is dropped; everything after it is realigned and arrives in order
+    assert [m for m in msgs if m.startswith(head) or m == line] == [good, good, line, good, good]
+
+
+def _free_udp_addr():
+    tmp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    tmp.bind(("127.0.0.1", 0))
+    addr = tmp.getsockname()
+    tmp.close()
+    return addr
+
+
+def _adapter_roundtrip():
+    """Build a UDP adapter, feed it one packet, and exit 0 if it was ingested."""
+    host, port = _free_udp_addr()
+    adapter = HardwarePlantAdapter(transport="udp", udp_bind_host=host, udp_bind_port=port)
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sock.sendto(json.dumps({"E": 0.5}).encode("utf-8"), (host, port))
+        t0 = time.time()
+        while time.time() - t0 < 2.0 and math.isnan(adapter.read_state()["E"]):
+            time.sleep(0.01)
+        ok = adapter.read_state()["E"] == 0.5
+    finally:
+        adapter.close()
+        sock.close()
+    raise SystemExit(0 if ok else 1)
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork()")
+def test_hw_adapter_udp_in_forked_child():
+    """An adapter built in a forked worker gets its own I/O loop instead of hanging."""
+    host, port = _free_udp_addr()
+    parent = HardwarePlantAdapter(transport="udp", udp_bind_host=host, udp_bind_port=port)
+    try:
+        proc = multiprocessing.get_context("fork").Process(target=_adapter_roundtrip)
+        proc.start()
+        proc.join(10.0)
+        if proc.is_alive():
+            proc.kill()
+            proc.join()
+        assert proc.exitcode == 0
+    finally:
+        parent.close()
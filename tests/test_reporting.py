@@ -0,0 +1,116 @@
+"""Tests: Reporting writers and helpers.
+
+Covers the SC1 table export policy and schema checks, and the timeline's
+sidecar loader, plot decimation, and tick thinning.
+"""
+
+from __future__ import annotations
+
+import csv
+import random
+
+import numpy as np
+import pytest
+
+from ldtc.reporting.tables import write_sc1_table
+from ldtc.reporting.timeline import _envelope_indices, _read_sidecar, _thin_ticks
+
+_ROW = {"eta": "power_sag", "delta": 0.1, "tau_rec": 2.0, "M_post": 9.0, "pass": True}
+
+
+def test_sc1_table_rejects_raw_key_in_later_row(tmp_path):
+    """A banned raw LREG key anywhere blocks the export, ahead of the schema error."""
+    out = tmp_path / "sc1.csv"
+    with pytest.raises(ValueError, match="raw LREG"):
+        write_sc1_table([_ROW, dict(_ROW, L_loop=1.0)], str(out))
+    assert not out.exists()
+
+
+def test_sc1_table_rejects_extra_fields_without_writing(tmp_path):
+    """Fields missing from the first row are rejected before the file is created."""
+    out = tmp_path / "sc1.csv"
+    with pytest.raises(ValueError, match="not in the first row"):
+        write_sc1_table([_ROW, dict(_ROW, extra=1)], str(out))
+    assert not out.exists()
+
+
+def test_sc1_table_fills_missing_fields_with_empty(tmp_path):
+    """Rows lacking some of the first row's fields are written with empty cells."""
+    out = tmp_path / "sc1.csv"
+    write_sc1_table([_ROW, {"eta": "ingress_flood", "delta": 0.2}], str(out))
+    with open(out, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows == [
+        list(_ROW),
+        ["power_sag", "0.1", "2.0", "9.0", "True"],
+        ["ingress_flood", "0.2", "", "", ""],
+    ]
+
+
+def _sidecar_rows_reference(path):
+    """Per-row DictReader parse the sidecar loader must agree with."""
+    out = []
+    with open(path, "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            try:
+                out.append((float(row.get("time_s", row.get("t", "0"))), float(row["L_loop"]), float(row["L_ex"])))
+            except Exception:
+                continue
+    return out
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "time_s,L_loop,L_ex,M_db\n0,1.5,1,3\n0.1,2,1,4\n\n0.2,3e2,1,5\n",  # loadtxt fast path
+        "L_ex,t,L_loop\n1,0,2\n1,0.5,3\n",  # `t` column, reordered
+        'time_s,L_loop,L_ex\n"0","1","2"\n1,2,3\n',  # quoted cells
+        "time_s,L_loop,L_ex\n0,1,\n1,2,3\n",  # blank cell
+        "time_s,L_loop,L_ex\nx,1,2\n1,2,3\n",  # non-numeric cell
+        "L_loop,L_ex\n2,1\n3,1\n",  # no time column
+        "time_s,L_loop,L_ex\n",  # header only
+    ],
+)
+def test_read_sidecar_matches_row_parse(tmp_path, text):
+    """The loadtxt path and its fallback agree with a per-row DictReader parse."""
+    path = tmp_path / "sidecar.csv"
+    path.write_text(text, encoding="utf-8")
+    t, loop, ex = _read_sidecar(str(path))
+    assert list(zip(t.tolist(), loop.tolist(), ex.tolist())) == _sidecar_rows_reference(str(path))
+
+
+def test_envelope_indices_keep_extrema_and_endpoints():
+    """Decimation keeps first/last samples and every bucket's min and max."""
+    y = np.arange(10, dtype=float)
+    assert np.array_equal(_envelope_indices(y, max_points=20), np.arange(10))
+
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=10_001)
+    y[1234], y[8765] = 50.0, -50.0
+    keep = _envelope_indices(y, max_points=100)
+    assert keep[0] == 0 and keep[-1] == len(y) - 1
+    assert np.all(np.diff(keep) > 0)
+    assert len(keep) <= 2 * 100 + 2
+    assert {1234, 8765} <= set(keep.tolist())
+    assert y[keep].min() == y.min() and y[keep].max() == y.max()
+
+
+def _thin_ticks_reference(times, spacing):
+    """Original greedy loop that `_thin_ticks` replaces."""
+    kept: list[float] = []
+    for tt in sorted(times):
+        if not kept or (tt - kept[-1]) >= max(0.0, spacing):
+            kept.append(tt)
+    return kept
+
+
+def test_thin_ticks_matches_greedy_loop():
+    """Bisect-based thinning keeps exactly the ticks the greedy loop keeps."""
+    rng = random.Random(0)
+    for _ in range(2000):
+        times = [
+            round(rng.random() * rng.choice([1, 10, 100]), rng.choice([1, 2, 8])) for _ in range(rng.randint(0, 40))
+        ]
+        times += times[:2]  # duplicates
+        spacing = rng.choice([-1.0, 0.0, 0.1, 0.3, 0.75, 1.0])
+        assert _thin_ticks(times, spacing) == _thin_ticks_reference(times, spacing)
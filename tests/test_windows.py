@@ -0,0 +1,48 @@
+"""Tests: Sliding window ring buffer.
+
+Checks oldest-first ordering across wrap-around, copy semantics, and reset.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from ldtc.runtime.windows import SlidingWindow
+
+
+def test_sliding_window_wraps_oldest_first():
+    """After more than `capacity` appends, the matrix holds the last rows oldest-first."""
+    w = SlidingWindow(4, ["a", "b"])
+    for i in range(3):
+        w.append({"a": i, "b": -i})
+    assert not w.ready()
+    with pytest.raises(RuntimeError):
+        w.get_matrix()
+
+    # Cover both the aligned (head == 0) and wrapped ring layouts
+    for n in (4, 7, 8, 9):
+        w.clear()
+        for i in range(n):
+            w.append({"a": i})  # "b" missing -> 0.0
+        assert w.ready()
+        expected = np.array([[i, 0.0] for i in range(n - 4, n)])
+        assert np.array_equal(w.get_matrix(), expected)
+
+
+def test_sliding_window_matrix_is_copy_and_clear_resets():
+    """The returned matrix is detached from the buffer, and clear() empties the window."""
+    w = SlidingWindow(3, ["x"])
+    for i in range(5):
+        w.append({"x": i})
+    m = w.get_matrix()
+    m[:] = -1.0
+    w.append({"x": 5})
+    assert np.array_equal(w.get_matrix()[:, 0], [3.0, 4.0, 5.0])
+    assert np.array_equal(m[:, 0], [-1.0, -1.0, -1.0])
+
+    w.clear()
+    assert not w.ready()
+    for i in range(3):
+        w.append({"x": 10 + i})
+    assert np.array_equal(w.get_matrix()[:, 0], [10.0, 11.0, 12.0])